@@ -3,26 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import homeassistant.helpers.config_validation as cv
+from homeassistant.components import http
 from homeassistant.components.lovelace.resources import ResourceStorageCollection
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
-
-# Try importing StaticPathConfig for HA 2024.6+, fall back for older versions
-try:
-    from homeassistant.components.http import StaticPathConfig
-
-    HAS_STATIC_PATH_CONFIG = True
-except ImportError:
-    HAS_STATIC_PATH_CONFIG = False
+from homeassistant.setup import async_when_setup
 
 from .const import DOMAIN
 from .coordinator import AlarmClockCoordinator
@@ -33,8 +29,14 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-# Config schema for the integration
-CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+# Fetch both registry fields the orphan scan needs in one call per entity
+_entity_and_unique_id = attrgetter("entity_id", "unique_id")
+
+# StaticPathConfig exists on HA 2024.6+, older versions only have register_static_path
+HAS_STATIC_PATH_CONFIG = hasattr(http, "StaticPathConfig")
+
+# Config schema for the integration (set up via config entries only, no YAML)
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 # Path to the card JavaScript file
@@ -55,6 +57,13 @@ CARD_VERSION = _get_version()
 CARD_JS_URL = f"/{DOMAIN}/alarm-clock-card.js"
 CARD_JS_URL_VERSIONED = f"/{DOMAIN}/alarm-clock-card.js?v={CARD_VERSION}"
 CARD_JS_PATH = Path(__file__).parent / "alarm-clock-card.js"
+CARD_JS_PATH_STR = str(CARD_JS_PATH)
+
+
+def _card_js_digest() -> str:
+    """Return a short content hash of the card file (blocking, run in executor)."""
+    return hashlib.sha1(CARD_JS_PATH.read_bytes(), usedforsecurity=False).hexdigest()[:12]
+
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -70,40 +79,40 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     try:
         # Register the static path for the card JavaScript file
+        # The Lovelace resource URL carries the card version and content hash, so
+        # browsers can cache the card and any change still busts it by changing the URL
         # Use new API (HA 2024.6+) or fall back to old API
         if HAS_STATIC_PATH_CONFIG:
             await hass.http.async_register_static_paths(
-                [StaticPathConfig(CARD_JS_URL, str(CARD_JS_PATH), cache_headers=False)]
+                [http.StaticPathConfig(CARD_JS_URL, CARD_JS_PATH_STR, cache_headers=True)]
             )
         else:
             # Fallback for older Home Assistant versions
-            hass.http.register_static_path(CARD_JS_URL, str(CARD_JS_PATH), cache_headers=False)
+            hass.http.register_static_path(CARD_JS_URL, CARD_JS_PATH_STR, cache_headers=True)
         _LOGGER.debug("Registered static path for alarm clock card: %s", CARD_JS_URL)
     except Exception as err:
         _LOGGER.warning("Could not register static path for card: %s", err)
         # Don't fail setup - the card just won't be available
 
+    # Register the Lovelace resource once lovelace is set up (right away if it already is)
+    async_when_setup(hass, "lovelace", _async_on_lovelace_setup)
+
+    return True
+
+
+async def _async_on_lovelace_setup(hass: HomeAssistant, component: str) -> None:
+    """Register the Lovelace resource after the lovelace component is set up."""
     try:
-        # Register the Lovelace resource (non-blocking, failures logged but don't stop setup)
         await _async_register_lovelace_resource(hass)
     except Exception as err:
         _LOGGER.warning("Could not register Lovelace resource: %s", err)
         # Don't fail setup - user can add resource manually
 
-    return True
-
 
 async def _async_register_lovelace_resource(hass: HomeAssistant) -> None:
     """Register the alarm clock card as a Lovelace resource."""
+    # Bound before the try so the manual-setup hint below always has a URL
     resource_url = CARD_JS_URL_VERSIONED
-
-    # Check if lovelace resources component is available
-    if "lovelace" not in hass.data:
-        _LOGGER.debug("Lovelace not yet loaded, will register resource later")
-        # Store flag to register resource when first entry is set up
-        hass.data[DOMAIN]["_register_resource"] = True
-        return
-
     try:
         # Get the resources collection
         lovelace_data = hass.data["lovelace"]
@@ -113,22 +122,41 @@ async def _async_register_lovelace_resource(hass: HomeAssistant) -> None:
             _LOGGER.debug("Lovelace resources not available (YAML mode?)")
             return
 
-        # Check if resource is already registered and remove old versions
+        # Hash the card once per start so a changed card busts browser caches even
+        # without a version bump (the static path is served with cache headers)
+        try:
+            digest = await hass.async_add_executor_job(_card_js_digest)
+            resource_url = f"{CARD_JS_URL_VERSIONED}-{digest}"
+        except OSError as err:
+            _LOGGER.debug("Could not hash card file, using version only: %s", err)
+
+        # One pass over the resources: only our card's URLs matter, either the current
+        # one or old versions of it (with or without version parameter)
         resource_found = False
+        old_resources: list[tuple[str, str]] = []
         for resource in resources.async_items():
             url = resource.get("url", "")
-            # Check if this is our resource (with or without version parameter)
-            if url.startswith(CARD_JS_URL):
-                if url == resource_url:
-                    _LOGGER.debug("Alarm clock card resource already registered")
-                    resource_found = True
-                else:
-                    # Remove old version
-                    _LOGGER.debug("Removing old alarm clock card resource: %s", url)
-                    try:
-                        await resources.async_delete_item(resource["id"])
-                    except Exception as del_err:
-                        _LOGGER.warning("Could not remove old resource: %s", del_err)
+            if not url.startswith(CARD_JS_URL):
+                continue
+            if url == resource_url:
+                resource_found = True
+            else:
+                old_resources.append((url, resource["id"]))
+
+        if resource_found:
+            _LOGGER.debug("Alarm clock card resource already registered")
+
+        # Deletions are independent of each other, so run them concurrently
+        results = await asyncio.gather(
+            *(resources.async_delete_item(item_id) for _, item_id in old_resources),
+            return_exceptions=True,
+        )
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        for (url, _), result in zip(old_resources, results, strict=True):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Could not remove old resource %s: %s", url, result)
+            elif debug_enabled:
+                _LOGGER.debug("Removed old alarm clock card resource: %s", url)
 
         if not resource_found:
             # Register the new resource
@@ -146,60 +174,84 @@ async def _async_register_lovelace_resource(hass: HomeAssistant) -> None:
 
 async def _async_cleanup_orphan_entities(
     hass: HomeAssistant, entry: ConfigEntry, valid_alarm_ids: set[str]
-) -> None:
-    """Remove orphan entities that reference non-existent alarms."""
+) -> bool:
+    """Remove orphan entities that reference non-existent alarms.
+
+    Returns True if no orphan entities are left behind.
+    """
     entity_registry = er.async_get(hass)
-    entities_to_remove = []
-
-    # Find entities belonging to this config entry
-    for entity_id, entity_entry in entity_registry.entities.items():
-        if entity_entry.config_entry_id != entry.entry_id:
-            continue
-
-        # Check if this entity is for a specific alarm (not a device-level entity)
-        unique_id = entity_entry.unique_id or ""
-        # Device-level entities don't have alarm IDs in their unique_id
-        # Alarm-specific entities have format: {entry_id}_{alarm_id}_{entity_type}
-        if not unique_id.startswith(entry.entry_id):
-            continue
-
-        # Extract potential alarm_id from unique_id
-        # Format: {entry_id}_{alarm_id}_{entity_type}
-        parts = unique_id.split("_")
-        if len(parts) >= 3:
-            # Reconstruct the alarm_id (it might contain underscores)
-            # The alarm_id is between entry_id and the last part (entity_type)
-            potential_alarm_id = "_".join(parts[1:-1])
-
-            # Skip device-level entities (they don't have alarm_ prefix)
-            if not potential_alarm_id.startswith("alarm_"):
-                continue
 
-            # Check if this alarm still exists
-            if potential_alarm_id not in valid_alarm_ids:
-                entities_to_remove.append((entity_id, potential_alarm_id))
+    # Alarm-specific entities have format: {entry_id}_{alarm_id}_{entity_type}
+    unique_id_prefix = f"{entry.entry_id}_"
+    # Entity types may contain underscores (e.g. next_trigger), so entities of
+    # alarms that still exist are recognised by their full alarm prefix
+    valid_prefixes = tuple(f"{alarm_id}_" for alarm_id in valid_alarm_ids)
+
+    def _orphan_alarm_id(unique_id: str | None) -> str | None:
+        """Return the missing alarm ID an entity belongs to, if any."""
+        unique_id = unique_id or ""
+        rest = unique_id.removeprefix(unique_id_prefix)
+        if rest == unique_id or rest.startswith(valid_prefixes):
+            return None
+
+        potential_alarm_id, sep, _ = rest.rpartition("_")
+
+        # Skip device-level entities (they don't have alarm_ prefix)
+        if not sep or not potential_alarm_id.startswith("alarm_"):
+            return None
+        return potential_alarm_id
+
+    # Find entities belonging to this config entry (backed by the registry's index)
+    entity_entries = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    entities_to_remove = [
+        (entity_id, alarm_id)
+        for entity_id, unique_id in map(_entity_and_unique_id, entity_entries)
+        if (alarm_id := _orphan_alarm_id(unique_id)) is not None
+    ]
+
+    if not entities_to_remove:
+        return True
+
+    _LOGGER.info(
+        "Removing %d orphan entities for alarms that no longer exist: %s",
+        len(entities_to_remove),
+        sorted({alarm_id for _, alarm_id in entities_to_remove}),
+    )
 
-    # Remove orphan entities
+    # Remove orphan entities in one pass; a single failure doesn't stop the rest.
+    # async_remove only schedules a debounced registry save, so the whole batch
+    # is written once rather than once per entity
+    removed = 0
     for entity_id, alarm_id in entities_to_remove:
-        _LOGGER.info(
-            "Removing orphan entity %s (alarm %s no longer exists)",
-            entity_id,
-            alarm_id,
-        )
-        entity_registry.async_remove(entity_id)
+        try:
+            entity_registry.async_remove(entity_id)
+            removed += 1
+        except Exception as err:
+            _LOGGER.warning(
+                "Could not remove orphan entity %s (alarm %s): %s", entity_id, alarm_id, err
+            )
 
-    if entities_to_remove:
-        _LOGGER.info("Cleaned up %d orphan entities", len(entities_to_remove))
+    _LOGGER.info("Cleaned up %d orphan entities", removed)
+    return removed == len(entities_to_remove)
+
+
+async def _async_cleanup_stored_orphans(
+    hass: HomeAssistant, entry: ConfigEntry, store: AlarmClockStore
+) -> None:
+    """Remove entities of alarms that are no longer in the store."""
+    # Runs even for a missing store file (e.g. deleted .storage), where leftover
+    # registry entries are most likely; a truly fresh install has none to walk
+    try:
+        await _async_cleanup_orphan_entities(hass, entry, set(store.iter_alarm_ids()))
+    except Exception as cleanup_err:
+        _LOGGER.warning("Error cleaning up orphan entities: %s", cleanup_err)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Alarm Clock from a config entry."""
     _LOGGER.debug("Setting up Alarm Clock integration: %s", entry.entry_id)
 
-    # Try to register Lovelace resource if not done during async_setup
-    if hass.data[DOMAIN].get("_register_resource"):
-        hass.data[DOMAIN].pop("_register_resource", None)
-        await _async_register_lovelace_resource(hass)
+    domain_data = hass.data.setdefault(DOMAIN, {})
 
     try:
         # Initialize store for persistent data
@@ -215,29 +267,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             # Continue with empty store - alarms will need to be recreated
 
         # Clean up orphan entities before creating new ones
-        try:
-            valid_alarm_ids = {alarm.alarm_id for alarm in store.get_all_alarms()}
-            await _async_cleanup_orphan_entities(hass, entry, valid_alarm_ids)
-        except Exception as cleanup_err:
-            _LOGGER.warning("Error cleaning up orphan entities: %s", cleanup_err)
+        await _async_cleanup_stored_orphans(hass, entry, store)
 
         # Create coordinator
         coordinator = AlarmClockCoordinator(hass, entry, store)
 
         # Store coordinator
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][entry.entry_id] = coordinator
+        domain_data[entry.entry_id] = coordinator
 
-        # Register device
+        # Register device on first setup; afterwards the entities' shared device info
+        # keeps the existing device up to date when the platforms add them
         device_registry = dr.async_get(hass)
-        device_registry.async_get_or_create(
-            config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=entry.title or "Alarm Clock",
-            manufacturer="Custom Integration",
-            model="Smart Alarm Clock",
-            sw_version="1.0.0",
-        )
+        device_info = coordinator.device_info
+        if device_registry.async_get_device(identifiers=device_info["identifiers"]) is None:
+            device_registry.async_get_or_create(config_entry_id=entry.entry_id, **device_info)
 
         # CRITICAL: Start the coordinator BEFORE setting up platforms
         # This ensures alarms are loaded from storage before entities try to access them
@@ -245,10 +288,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         # Setup platforms with timeout protection - entities can now access coordinator.alarms
         try:
-            await asyncio.wait_for(
-                hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
-                timeout=30.0,  # 30 second timeout for platform setup
-            )
+            async with asyncio.timeout(30.0):  # 30 second timeout for platform setup
+                await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
         except TimeoutError:
             _LOGGER.error(
                 "Timeout setting up platforms for Alarm Clock integration. "
@@ -256,8 +297,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
             # Stop coordinator since setup failed
             await coordinator.async_stop()
-            if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
-                hass.data[DOMAIN].pop(entry.entry_id)
+            domain_data.pop(entry.entry_id, None)
             return False
 
         # Validate referenced entities after startup
@@ -269,12 +309,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.info("Alarm Clock integration setup complete: %s", entry.entry_id)
         return True
 
-    except Exception as err:
-        _LOGGER.exception("Error setting up Alarm Clock integration: %s", err)
-        # Clean up if setup fails
-        if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
-            hass.data[DOMAIN].pop(entry.entry_id)
-        return False
+    except Exception:
+        # Clean up if setup fails, then let HA log the error and track the entry's
+        # setup state (including retries for ConfigEntryNotReady)
+        domain_data.pop(entry.entry_id, None)
+        raise
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -282,9 +321,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Unloading Alarm Clock integration: %s", entry.entry_id)
 
     unload_ok = True
+    domain_data = hass.data.get(DOMAIN, {})
 
     try:
-        coordinator: AlarmClockCoordinator | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+        coordinator: AlarmClockCoordinator | None = domain_data.get(entry.entry_id)
 
         if coordinator is None:
             _LOGGER.warning(
@@ -309,8 +349,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             unload_ok = False
 
         # Clean up from hass.data regardless of unload status
-        if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
-            hass.data[DOMAIN].pop(entry.entry_id, None)
+        domain_data.pop(entry.entry_id, None)
 
         if unload_ok:
             _LOGGER.info("Alarm Clock integration unloaded successfully: %s", entry.entry_id)
@@ -323,8 +362,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Error unloading Alarm Clock integration: %s", err, exc_info=True)
         # Try to clean up anyway to prevent lingering state
         try:
-            if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
-                hass.data[DOMAIN].pop(entry.entry_id, None)
+            domain_data.pop(entry.entry_id, None)
         except Exception:
             pass
         return False
@@ -22,6 +22,12 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Icons for ringing and snoozed alarms; any other state shows as off
+_RINGING_ICONS: dict[AlarmState, str] = {
+    AlarmState.RINGING: "mdi:alarm-light",
+    AlarmState.SNOOZED: "mdi:alarm-snooze",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,15 +37,12 @@ async def async_setup_entry(
     """Set up alarm clock binary sensor entities."""
     coordinator: AlarmClockCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[BinarySensorEntity] = []
-
-    # Create ringing sensor for each alarm
-    for _alarm_id, alarm in coordinator.alarms.items():
-        entities.append(AlarmRingingSensor(coordinator, entry, alarm))
-
-    # Create device-level sensors
-    entities.append(AlarmClockHealthSensor(coordinator, entry))
-    entities.append(AnyAlarmRingingSensor(coordinator, entry))
+    # Create ringing sensor for each alarm, followed by the device-level sensors
+    entities: list[BinarySensorEntity] = [
+        *(AlarmRingingSensor(coordinator, entry, alarm) for alarm in coordinator.alarms.values()),
+        AlarmClockHealthSensor(coordinator, entry),
+        AnyAlarmRingingSensor(coordinator, entry),
+    ]
 
     async_add_entities(entities)
 
@@ -71,7 +74,7 @@ class AlarmRingingSensor(AlarmClockEntity, BinarySensorEntity):
     def __init__(self, coordinator, entry, alarm) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, alarm)
-        self._attr_unique_id = f"{entry.entry_id}_{alarm.data.alarm_id}_ringing"
+        self._attr_unique_id = f"{self._unique_id_prefix}_ringing"
         self._attr_name = f"{alarm.data.name} Ringing"
 
     @property
@@ -88,11 +91,7 @@ class AlarmRingingSensor(AlarmClockEntity, BinarySensorEntity):
         alarm = self.alarm
         if alarm is None:
             return "mdi:alarm-off"
-        if alarm.state == AlarmState.RINGING:
-            return "mdi:alarm-light"
-        elif alarm.state == AlarmState.SNOOZED:
-            return "mdi:alarm-snooze"
-        return "mdi:alarm-off"
+        return _RINGING_ICONS.get(alarm.state, "mdi:alarm-off")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -127,18 +126,17 @@ class AlarmClockHealthSensor(AlarmClockDeviceEntity, BinarySensorEntity):
     @property
     def icon(self) -> str:
         """Return icon based on health status."""
-        if self.is_on:
-            return "mdi:heart-broken"
-        return "mdi:heart-pulse"
+        return "mdi:heart-broken" if self.is_on else "mdi:heart-pulse"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
+        health_status = self.coordinator.health_status
         return {
-            "last_check": self.coordinator.health_status.get("last_check"),
-            "issues": self.coordinator.health_status.get("issues", []),
-            "alarm_count": self.coordinator.health_status.get("alarm_count", 0),
-            "active_alarms": self.coordinator.health_status.get("active_alarms", 0),
+            "last_check": health_status.get("last_check"),
+            "issues": health_status.get("issues", []),
+            "alarm_count": health_status.get("alarm_count", 0),
+            "active_alarms": health_status.get("active_alarms", 0),
         }
 
 
@@ -157,21 +155,19 @@ class AnyAlarmRingingSensor(AlarmClockDeviceEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return true if any alarm is ringing."""
-        return any(
-            a.state in (AlarmState.RINGING, AlarmState.SNOOZED, AlarmState.PRE_ALARM)
-            for a in self.coordinator.alarms.values()
-        )
+        return bool(self.coordinator.active_alarm_ids)
 
     @property
     def icon(self) -> str:
         """Return icon based on state."""
-        if self.is_on:
-            return "mdi:alarm-light"
-        return "mdi:alarm-check"
+        return "mdi:alarm-light" if self.is_on else "mdi:alarm-check"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
+        # Walk alarms in their own order so the list is stable across restarts
+        # and matches the active alarm count sensor
+        active_ids = self.coordinator.active_alarm_ids
         ringing_alarms = [
             {
                 "alarm_id": a.data.alarm_id,
@@ -179,7 +175,7 @@ class AnyAlarmRingingSensor(AlarmClockDeviceEntity, BinarySensorEntity):
                 "state": a.state.value,
             }
             for a in self.coordinator.alarms.values()
-            if a.state in (AlarmState.RINGING, AlarmState.SNOOZED, AlarmState.PRE_ALARM)
+            if a.data.alarm_id in active_ids
         ]
 
         return {
@@ -19,6 +19,7 @@ from .const import (
     CONF_DAYS,
     CONF_DEFAULT_SCRIPT_ALARM,
     CONF_DEFAULT_SCRIPT_FALLBACK,
+    CONF_DEFAULT_SCRIPT_KEYS,
     CONF_DEFAULT_SCRIPT_ON_ARM,
     CONF_DEFAULT_SCRIPT_ON_CANCEL,
     CONF_DEFAULT_SCRIPT_ON_DISMISS,
@@ -69,17 +70,234 @@ from .validation import (
 _LOGGER = logging.getLogger(__name__)
 
 
-def _weekday_selector() -> selector.SelectSelector:
-    """Create weekday selector."""
-    return selector.SelectSelector(
-        selector.SelectSelectorConfig(
-            options=[
-                selector.SelectOptionDict(value=day, label=day.capitalize()) for day in WEEKDAYS
-            ],
-            multiple=True,
-            mode=selector.SelectSelectorMode.LIST,
-        )
+_DEVICE_DEFAULTS_INFO = (
+    "If 'Use Device Defaults' is enabled, the alarm will use the device-level "
+    "default scripts configured in Settings → Default Scripts."
+)
+_ADVANCED_INFO_TEXT = f"Configure advanced alarm settings. {_DEVICE_DEFAULTS_INFO}"
+_EDIT_INFO_TEXT = f"Edit alarm settings. {_DEVICE_DEFAULTS_INFO}"
+_DEFAULT_SCRIPTS_INFO_TEXT = (
+    "Configure default scripts that will be used by all alarms with 'Use Device Defaults' "
+    "enabled. These scripts apply automatically to new alarms."
+)
+
+
+# Selectors are immutable configuration, so every form shares these instances
+_WEEKDAY_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[selector.SelectOptionDict(value=day, label=day.capitalize()) for day in WEEKDAYS],
+        multiple=True,
+        mode=selector.SelectSelectorMode.LIST,
     )
+)
+_TIME_SELECTOR = selector.TimeSelector()
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+_SCRIPT_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain="script"))
+_SNOOZE_DURATION_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=60,
+        step=1,
+        unit_of_measurement="minutes",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_MAX_SNOOZE_COUNT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=10, step=1, mode=selector.NumberSelectorMode.BOX)
+)
+_AUTO_DISMISS_TIMEOUT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=180,
+        step=1,
+        unit_of_measurement="minutes",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_PRE_ALARM_DURATION_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=60,
+        step=1,
+        unit_of_measurement="minutes",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_SCRIPT_TIMEOUT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=300,
+        step=1,
+        unit_of_measurement="seconds",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_SCRIPT_RETRY_COUNT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=10, step=1, mode=selector.NumberSelectorMode.BOX)
+)
+
+# Slider variants used by the edit form
+_SNOOZE_DURATION_SLIDER = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=60, step=1, unit_of_measurement="minutes")
+)
+_MAX_SNOOZE_COUNT_SLIDER = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=10, step=1)
+)
+_AUTO_DISMISS_TIMEOUT_SLIDER = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=180, step=1, unit_of_measurement="minutes")
+)
+_PRE_ALARM_DURATION_SLIDER = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=60, step=1, unit_of_measurement="minutes")
+)
+
+# Global settings form
+_WATCHDOG_TIMEOUT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=10, max=300, step=10, unit_of_measurement="seconds")
+)
+_MISSED_ALARM_GRACE_PERIOD_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=60, step=1, unit_of_measurement="minutes")
+)
+
+_MANAGE_ALARMS_MODE = selector.SelectSelectorMode.DROPDOWN
+
+
+# (field, min, max) bounds checked on alarm add submissions
+_NUMERIC_BOUNDS: tuple[tuple[str, int, int], ...] = (
+    (CONF_SNOOZE_DURATION, 1, 60),
+    (CONF_MAX_SNOOZE_COUNT, 0, 10),
+    (CONF_AUTO_DISMISS_TIMEOUT, 1, 180),
+    (CONF_PRE_ALARM_DURATION, 0, 60),
+    (CONF_SCRIPT_TIMEOUT, 1, 300),
+    (CONF_SCRIPT_RETRY_COUNT, 0, 10),
+)
+
+# Current values are filled in per render with add_suggested_values_to_schema
+_DEFAULT_SCRIPTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_DEFAULT_SCRIPT_PRE_ALARM): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_DEFAULT_SCRIPT_ALARM): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_DEFAULT_SCRIPT_POST_ALARM): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_DEFAULT_SCRIPT_ON_SNOOZE): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_DEFAULT_SCRIPT_ON_DISMISS): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_DEFAULT_SCRIPT_ON_ARM): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_DEFAULT_SCRIPT_ON_CANCEL): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_DEFAULT_SCRIPT_ON_SKIP): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_DEFAULT_SCRIPT_FALLBACK): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_DEFAULT_SCRIPT_TIMEOUT): _SCRIPT_TIMEOUT_SELECTOR,
+        vol.Optional(CONF_DEFAULT_SCRIPT_RETRY_COUNT): _SCRIPT_RETRY_COUNT_SELECTOR,
+    }
+)
+
+# Edit form fields copied onto AlarmData as submitted
+_EDITABLE_FIELD_MAP: dict[str, str] = {
+    CONF_DAYS: "days",
+    CONF_SNOOZE_DURATION: "snooze_duration",
+    CONF_MAX_SNOOZE_COUNT: "max_snooze_count",
+    CONF_AUTO_DISMISS_TIMEOUT: "auto_dismiss_timeout",
+    CONF_PRE_ALARM_DURATION: "pre_alarm_duration",
+}
+
+# Edit form script fields and the AlarmData attributes they set
+_SCRIPT_FIELD_MAP: dict[str, str] = {
+    CONF_SCRIPT_PRE_ALARM: "script_pre_alarm",
+    CONF_SCRIPT_ALARM: "script_alarm",
+    CONF_SCRIPT_POST_ALARM: "script_post_alarm",
+    CONF_SCRIPT_ON_SNOOZE: "script_on_snooze",
+    CONF_SCRIPT_ON_DISMISS: "script_on_dismiss",
+    CONF_SCRIPT_ON_ARM: "script_on_arm",
+    CONF_SCRIPT_ON_CANCEL: "script_on_cancel",
+    CONF_SCRIPT_ON_SKIP: "script_on_skip",
+    CONF_SCRIPT_FALLBACK: "script_fallback",
+}
+
+# Advanced form fields kept when the device defaults toggle re-renders the form
+_PRESERVED_ADVANCED_KEYS = frozenset(
+    {
+        CONF_SNOOZE_DURATION,
+        CONF_MAX_SNOOZE_COUNT,
+        CONF_AUTO_DISMISS_TIMEOUT,
+        CONF_PRE_ALARM_DURATION,
+        CONF_SCRIPT_TIMEOUT,
+        CONF_SCRIPT_RETRY_COUNT,
+        CONF_SCRIPT_PRE_ALARM,
+        CONF_SCRIPT_ALARM,
+        CONF_SCRIPT_POST_ALARM,
+        CONF_SCRIPT_ON_SNOOZE,
+        CONF_SCRIPT_ON_DISMISS,
+        CONF_SCRIPT_FALLBACK,
+    }
+)
+
+
+# The advanced alarm form only depends on the device defaults toggle, so both
+# variants are built once
+_ADVANCED_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_SNOOZE_DURATION, default=DEFAULT_SNOOZE_DURATION
+        ): _SNOOZE_DURATION_SELECTOR,
+        vol.Optional(
+            CONF_MAX_SNOOZE_COUNT, default=DEFAULT_MAX_SNOOZE_COUNT
+        ): _MAX_SNOOZE_COUNT_SELECTOR,
+        vol.Optional(
+            CONF_AUTO_DISMISS_TIMEOUT, default=DEFAULT_AUTO_DISMISS_TIMEOUT
+        ): _AUTO_DISMISS_TIMEOUT_SELECTOR,
+        vol.Optional(
+            CONF_PRE_ALARM_DURATION, default=DEFAULT_PRE_ALARM_DURATION
+        ): _PRE_ALARM_DURATION_SELECTOR,
+        vol.Optional(CONF_USE_DEVICE_DEFAULTS, default=True): _BOOLEAN_SELECTOR,
+    }
+)
+_ADVANCED_SCRIPTS_SCHEMA = _ADVANCED_SCHEMA.extend(
+    {
+        vol.Optional(CONF_SCRIPT_PRE_ALARM): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_ALARM): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_POST_ALARM): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_ON_SNOOZE): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_ON_DISMISS): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_FALLBACK): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_TIMEOUT, default=DEFAULT_SCRIPT_TIMEOUT): _SCRIPT_TIMEOUT_SELECTOR,
+        vol.Optional(
+            CONF_SCRIPT_RETRY_COUNT, default=DEFAULT_SCRIPT_RETRY_COUNT
+        ): _SCRIPT_RETRY_COUNT_SELECTOR,
+    }
+)
+
+# Edit form variants; the alarm's current values are filled in per render with
+# add_suggested_values_to_schema. The selectors enforce the bounds and Coerce
+# stores whole numbers
+_EDIT_SCHEMA_WITH_DEFAULTS = vol.Schema(
+    {
+        vol.Required(CONF_ALARM_NAME): cv.string,
+        vol.Required(CONF_ALARM_TIME): _TIME_SELECTOR,
+        vol.Required(CONF_DAYS): _WEEKDAY_SELECTOR,
+        vol.Optional(CONF_SNOOZE_DURATION): vol.All(_SNOOZE_DURATION_SLIDER, vol.Coerce(int)),
+        vol.Optional(CONF_MAX_SNOOZE_COUNT): vol.All(_MAX_SNOOZE_COUNT_SLIDER, vol.Coerce(int)),
+        vol.Optional(CONF_AUTO_DISMISS_TIMEOUT): vol.All(
+            _AUTO_DISMISS_TIMEOUT_SLIDER, vol.Coerce(int)
+        ),
+        vol.Optional(CONF_PRE_ALARM_DURATION): vol.All(_PRE_ALARM_DURATION_SLIDER, vol.Coerce(int)),
+        vol.Optional(CONF_USE_DEVICE_DEFAULTS): _BOOLEAN_SELECTOR,
+    }
+)
+# Individual script fields are only shown when NOT using device defaults
+_EDIT_SCHEMA = _EDIT_SCHEMA_WITH_DEFAULTS.extend(
+    {
+        vol.Optional(CONF_SCRIPT_PRE_ALARM): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_ALARM): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_POST_ALARM): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_ON_SNOOZE): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_ON_DISMISS): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_ON_ARM): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_ON_CANCEL): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_ON_SKIP): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_FALLBACK): _SCRIPT_SELECTOR,
+        vol.Optional(CONF_SCRIPT_TIMEOUT): vol.All(_SCRIPT_TIMEOUT_SELECTOR, vol.Coerce(int)),
+        vol.Optional(CONF_SCRIPT_RETRY_COUNT): vol.All(
+            _SCRIPT_RETRY_COUNT_SELECTOR, vol.Coerce(int)
+        ),
+    }
+)
 
 
 class AlarmClockConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -132,199 +350,37 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
 
     def _build_advanced_schema(self, use_defaults: bool) -> vol.Schema:
         """Build the advanced alarm settings schema."""
-        schema_dict = {
-            vol.Optional(
-                CONF_SNOOZE_DURATION, default=DEFAULT_SNOOZE_DURATION
-            ): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=1,
-                    max=60,
-                    step=1,
-                    unit_of_measurement="minutes",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            ),
-            vol.Optional(
-                CONF_MAX_SNOOZE_COUNT, default=DEFAULT_MAX_SNOOZE_COUNT
-            ): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=0, max=10, step=1, mode=selector.NumberSelectorMode.BOX
-                )
-            ),
-            vol.Optional(
-                CONF_AUTO_DISMISS_TIMEOUT, default=DEFAULT_AUTO_DISMISS_TIMEOUT
-            ): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=1,
-                    max=180,
-                    step=1,
-                    unit_of_measurement="minutes",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            ),
-            vol.Optional(
-                CONF_PRE_ALARM_DURATION, default=DEFAULT_PRE_ALARM_DURATION
-            ): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=0,
-                    max=60,
-                    step=1,
-                    unit_of_measurement="minutes",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            ),
-            vol.Optional(CONF_USE_DEVICE_DEFAULTS, default=True): selector.BooleanSelector(),
-        }
-
         # Only show individual script fields if NOT using device defaults
-        if not use_defaults:
-            schema_dict.update(
-                {
-                    vol.Optional(CONF_SCRIPT_PRE_ALARM): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="script")
-                    ),
-                    vol.Optional(CONF_SCRIPT_ALARM): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="script")
-                    ),
-                    vol.Optional(CONF_SCRIPT_POST_ALARM): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="script")
-                    ),
-                    vol.Optional(CONF_SCRIPT_ON_SNOOZE): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="script")
-                    ),
-                    vol.Optional(CONF_SCRIPT_ON_DISMISS): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="script")
-                    ),
-                    vol.Optional(CONF_SCRIPT_FALLBACK): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="script")
-                    ),
-                    vol.Optional(
-                        CONF_SCRIPT_TIMEOUT, default=DEFAULT_SCRIPT_TIMEOUT
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1,
-                            max=300,
-                            step=1,
-                            unit_of_measurement="seconds",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_SCRIPT_RETRY_COUNT, default=DEFAULT_SCRIPT_RETRY_COUNT
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0, max=10, step=1, mode=selector.NumberSelectorMode.BOX
-                        )
-                    ),
-                }
-            )
-
-        return vol.Schema(schema_dict)
+        return _ADVANCED_SCHEMA if use_defaults else _ADVANCED_SCRIPTS_SCHEMA
 
     def _build_edit_alarm_schema(
         self, alarm: AlarmStateMachine, use_defaults: bool | None = None
     ) -> vol.Schema:
         """Build the edit alarm schema with current values."""
+        # Use provided use_defaults or fall back to alarm's current setting
+        if use_defaults is None:
+            use_defaults = alarm.data.use_device_defaults
+
         # Parse current time
         try:
-            hour, minute = map(int, alarm.data.time.split(":"))
-            current_time = {"hours": hour, "minutes": minute}
+            hour, _, minute = alarm.data.time.partition(":")
+            current_time = {"hours": int(hour), "minutes": int(minute)}
         except (ValueError, AttributeError):
             current_time = {"hours": 7, "minutes": 0}
 
-        # Use provided use_defaults or fall back to alarm's current setting
-        if use_defaults is None:
-            use_defaults = alarm.data.use_device_defaults
-
-        schema_dict = {
-            vol.Required(CONF_ALARM_NAME, default=alarm.data.name): cv.string,
-            vol.Required(CONF_ALARM_TIME, default=current_time): selector.TimeSelector(),
-            vol.Required(CONF_DAYS, default=alarm.data.days): _weekday_selector(),
-            vol.Optional(
-                CONF_SNOOZE_DURATION, default=alarm.data.snooze_duration
-            ): selector.NumberSelector(
-                selector.NumberSelectorConfig(min=1, max=60, step=1, unit_of_measurement="minutes")
-            ),
-            vol.Optional(
-                CONF_MAX_SNOOZE_COUNT, default=alarm.data.max_snooze_count
-            ): selector.NumberSelector(selector.NumberSelectorConfig(min=0, max=10, step=1)),
-            vol.Optional(
-                CONF_AUTO_DISMISS_TIMEOUT, default=alarm.data.auto_dismiss_timeout
-            ): selector.NumberSelector(
-                selector.NumberSelectorConfig(min=1, max=180, step=1, unit_of_measurement="minutes")
-            ),
-            vol.Optional(
-                CONF_PRE_ALARM_DURATION, default=alarm.data.pre_alarm_duration
-            ): selector.NumberSelector(
-                selector.NumberSelectorConfig(min=0, max=60, step=1, unit_of_measurement="minutes")
-            ),
-            vol.Optional(
-                CONF_USE_DEVICE_DEFAULTS, default=alarm.data.use_device_defaults
-            ): selector.BooleanSelector(),
+        # The toggle keeps the stored setting so a re-render is not taken as a change
+        suggested: dict[str, Any] = {
+            CONF_ALARM_NAME: alarm.data.name,
+            CONF_ALARM_TIME: current_time,
+            CONF_USE_DEVICE_DEFAULTS: alarm.data.use_device_defaults,
+            CONF_SCRIPT_TIMEOUT: alarm.data.script_timeout,
+            CONF_SCRIPT_RETRY_COUNT: alarm.data.script_retry_count,
         }
+        for conf_key, attr in (*_EDITABLE_FIELD_MAP.items(), *_SCRIPT_FIELD_MAP.items()):
+            suggested[conf_key] = getattr(alarm.data, attr)
 
-        # Only show individual script fields if NOT using device defaults
-        if not use_defaults:
-            schema_dict.update(
-                {
-                    vol.Optional(
-                        CONF_SCRIPT_PRE_ALARM,
-                        description={"suggested_value": alarm.data.script_pre_alarm},
-                    ): selector.EntitySelector(selector.EntitySelectorConfig(domain="script")),
-                    vol.Optional(
-                        CONF_SCRIPT_ALARM,
-                        description={"suggested_value": alarm.data.script_alarm},
-                    ): selector.EntitySelector(selector.EntitySelectorConfig(domain="script")),
-                    vol.Optional(
-                        CONF_SCRIPT_POST_ALARM,
-                        description={"suggested_value": alarm.data.script_post_alarm},
-                    ): selector.EntitySelector(selector.EntitySelectorConfig(domain="script")),
-                    vol.Optional(
-                        CONF_SCRIPT_ON_SNOOZE,
-                        description={"suggested_value": alarm.data.script_on_snooze},
-                    ): selector.EntitySelector(selector.EntitySelectorConfig(domain="script")),
-                    vol.Optional(
-                        CONF_SCRIPT_ON_DISMISS,
-                        description={"suggested_value": alarm.data.script_on_dismiss},
-                    ): selector.EntitySelector(selector.EntitySelectorConfig(domain="script")),
-                    vol.Optional(
-                        CONF_SCRIPT_ON_ARM,
-                        description={"suggested_value": alarm.data.script_on_arm},
-                    ): selector.EntitySelector(selector.EntitySelectorConfig(domain="script")),
-                    vol.Optional(
-                        CONF_SCRIPT_ON_CANCEL,
-                        description={"suggested_value": alarm.data.script_on_cancel},
-                    ): selector.EntitySelector(selector.EntitySelectorConfig(domain="script")),
-                    vol.Optional(
-                        CONF_SCRIPT_ON_SKIP,
-                        description={"suggested_value": alarm.data.script_on_skip},
-                    ): selector.EntitySelector(selector.EntitySelectorConfig(domain="script")),
-                    vol.Optional(
-                        CONF_SCRIPT_FALLBACK,
-                        description={"suggested_value": alarm.data.script_fallback},
-                    ): selector.EntitySelector(selector.EntitySelectorConfig(domain="script")),
-                    vol.Optional(
-                        CONF_SCRIPT_TIMEOUT, default=alarm.data.script_timeout
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1,
-                            max=300,
-                            step=1,
-                            unit_of_measurement="seconds",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_SCRIPT_RETRY_COUNT, default=alarm.data.script_retry_count
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0, max=10, step=1, mode=selector.NumberSelectorMode.BOX
-                        )
-                    ),
-                }
-            )
-
-        return vol.Schema(schema_dict)
+        schema = _EDIT_SCHEMA_WITH_DEFAULTS if use_defaults else _EDIT_SCHEMA
+        return self.add_suggested_values_to_schema(schema, suggested)
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Manage the options."""
@@ -367,8 +423,8 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_ALARM_NAME): cv.string,
-                    vol.Required(CONF_ALARM_TIME, default=default_time): selector.TimeSelector(),
-                    vol.Required(CONF_DAYS, default=WEEKDAYS[:5]): _weekday_selector(),
+                    vol.Required(CONF_ALARM_TIME, default=default_time): _TIME_SELECTOR,
+                    vol.Required(CONF_DAYS, default=WEEKDAYS[:5]): _WEEKDAY_SELECTOR,
                     vol.Optional(CONF_ONE_TIME, default=False): cv.boolean,
                     vol.Optional(CONF_ENABLED, default=True): cv.boolean,
                 }
@@ -391,44 +447,22 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
                 # Toggle changed - update stored data and re-show form with new schema
                 self._alarm_data[CONF_USE_DEVICE_DEFAULTS] = current_use_defaults
                 # Preserve other fields that were filled in, including script selections
-                for key in [
-                    CONF_SNOOZE_DURATION,
-                    CONF_MAX_SNOOZE_COUNT,
-                    CONF_AUTO_DISMISS_TIMEOUT,
-                    CONF_PRE_ALARM_DURATION,
-                    CONF_SCRIPT_TIMEOUT,
-                    CONF_SCRIPT_RETRY_COUNT,
-                    CONF_SCRIPT_PRE_ALARM,
-                    CONF_SCRIPT_ALARM,
-                    CONF_SCRIPT_POST_ALARM,
-                    CONF_SCRIPT_ON_SNOOZE,
-                    CONF_SCRIPT_ON_DISMISS,
-                    CONF_SCRIPT_FALLBACK,
-                ]:
-                    if key in user_input:
-                        self._alarm_data[key] = user_input[key]
+                self._alarm_data.update(
+                    {key: user_input[key] for key in _PRESERVED_ADVANCED_KEYS & user_input.keys()}
+                )
 
                 alarm_name = self._alarm_data.get(CONF_ALARM_NAME, "New Alarm")
                 return self.async_show_form(
                     step_id="alarm_advanced",
                     description_placeholders={
                         "alarm_name": alarm_name,
-                        "info": "Configure advanced alarm settings. If 'Use Device Defaults' is enabled, the alarm will use the device-level default scripts configured in Settings → Default Scripts.",
+                        "info": _ADVANCED_INFO_TEXT,
                     },
                     data_schema=self._build_advanced_schema(current_use_defaults),
                 )
 
             # Validate numeric fields
-            numeric_validations = {
-                CONF_SNOOZE_DURATION: (1, 60),
-                CONF_MAX_SNOOZE_COUNT: (0, 10),
-                CONF_AUTO_DISMISS_TIMEOUT: (1, 180),
-                CONF_PRE_ALARM_DURATION: (0, 60),
-                CONF_SCRIPT_TIMEOUT: (1, 300),
-                CONF_SCRIPT_RETRY_COUNT: (0, 10),
-            }
-
-            for field, (min_val, max_val) in numeric_validations.items():
+            for field, min_val, max_val in _NUMERIC_BOUNDS:
                 if field in user_input:
                     try:
                         user_input[field] = validate_duration(
@@ -439,22 +473,21 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
                         errors[field] = "invalid_value"
 
             if errors:
-                # Re-show form with errors
-                # Read use_defaults from user_input to reflect the current toggle state
-                use_defaults = user_input.get(CONF_USE_DEVICE_DEFAULTS, True)
+                # Re-show form with errors, reflecting the current toggle state
                 alarm_name = self._alarm_data.get(CONF_ALARM_NAME, "New Alarm")
                 return self.async_show_form(
                     step_id="alarm_advanced",
                     description_placeholders={
                         "alarm_name": alarm_name,
-                        "info": "Configure advanced alarm settings. If 'Use Device Defaults' is enabled, the alarm will use the device-level default scripts configured in Settings → Default Scripts.",
+                        "info": _ADVANCED_INFO_TEXT,
                     },
-                    data_schema=self._build_advanced_schema(use_defaults),
+                    data_schema=self._build_advanced_schema(current_use_defaults),
                     errors=errors,
                 )
 
             # Merge with basic alarm data
-            alarm_data = {**self._alarm_data, **user_input}
+            alarm_data = self._alarm_data | user_input
+            get = alarm_data.get
 
             # Add the alarm via coordinator
             coordinator = self.hass.data[DOMAIN].get(self.config_entry.entry_id)
@@ -477,7 +510,7 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
                     time_str = f"{int(time_parts[0]):02d}:{int(time_parts[1]):02d}"
 
                 # Determine if using device defaults
-                use_device_defaults = alarm_data.get(CONF_USE_DEVICE_DEFAULTS, True)
+                use_device_defaults = get(CONF_USE_DEVICE_DEFAULTS, True)
 
                 # If using device defaults, don't set individual scripts
                 # The coordinator will use device-level defaults instead
@@ -492,34 +525,28 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
                     script_retry_count = DEFAULT_SCRIPT_RETRY_COUNT
                 else:
                     # Use alarm-specific scripts from form
-                    script_pre_alarm = alarm_data.get(CONF_SCRIPT_PRE_ALARM)
-                    script_alarm = alarm_data.get(CONF_SCRIPT_ALARM)
-                    script_post_alarm = alarm_data.get(CONF_SCRIPT_POST_ALARM)
-                    script_on_snooze = alarm_data.get(CONF_SCRIPT_ON_SNOOZE)
-                    script_on_dismiss = alarm_data.get(CONF_SCRIPT_ON_DISMISS)
-                    script_fallback = alarm_data.get(CONF_SCRIPT_FALLBACK)
-                    script_timeout = alarm_data.get(CONF_SCRIPT_TIMEOUT, DEFAULT_SCRIPT_TIMEOUT)
-                    script_retry_count = alarm_data.get(
-                        CONF_SCRIPT_RETRY_COUNT, DEFAULT_SCRIPT_RETRY_COUNT
-                    )
+                    script_pre_alarm = get(CONF_SCRIPT_PRE_ALARM)
+                    script_alarm = get(CONF_SCRIPT_ALARM)
+                    script_post_alarm = get(CONF_SCRIPT_POST_ALARM)
+                    script_on_snooze = get(CONF_SCRIPT_ON_SNOOZE)
+                    script_on_dismiss = get(CONF_SCRIPT_ON_DISMISS)
+                    script_fallback = get(CONF_SCRIPT_FALLBACK)
+                    script_timeout = get(CONF_SCRIPT_TIMEOUT, DEFAULT_SCRIPT_TIMEOUT)
+                    script_retry_count = get(CONF_SCRIPT_RETRY_COUNT, DEFAULT_SCRIPT_RETRY_COUNT)
 
                 new_alarm = AlarmData(
                     alarm_id=alarm_id,
                     name=alarm_data[CONF_ALARM_NAME],
                     time=time_str,
-                    days=alarm_data.get(CONF_DAYS, WEEKDAYS[:5]),
-                    one_time=alarm_data.get(CONF_ONE_TIME, False),
-                    enabled=alarm_data.get(CONF_ENABLED, True),
-                    snooze_duration=alarm_data.get(CONF_SNOOZE_DURATION, DEFAULT_SNOOZE_DURATION),
-                    max_snooze_count=alarm_data.get(
-                        CONF_MAX_SNOOZE_COUNT, DEFAULT_MAX_SNOOZE_COUNT
-                    ),
-                    auto_dismiss_timeout=alarm_data.get(
+                    days=get(CONF_DAYS, WEEKDAYS[:5]),
+                    one_time=get(CONF_ONE_TIME, False),
+                    enabled=get(CONF_ENABLED, True),
+                    snooze_duration=get(CONF_SNOOZE_DURATION, DEFAULT_SNOOZE_DURATION),
+                    max_snooze_count=get(CONF_MAX_SNOOZE_COUNT, DEFAULT_MAX_SNOOZE_COUNT),
+                    auto_dismiss_timeout=get(
                         CONF_AUTO_DISMISS_TIMEOUT, DEFAULT_AUTO_DISMISS_TIMEOUT
                     ),
-                    pre_alarm_duration=alarm_data.get(
-                        CONF_PRE_ALARM_DURATION, DEFAULT_PRE_ALARM_DURATION
-                    ),
+                    pre_alarm_duration=get(CONF_PRE_ALARM_DURATION, DEFAULT_PRE_ALARM_DURATION),
                     use_device_defaults=use_device_defaults,
                     script_pre_alarm=script_pre_alarm,
                     script_alarm=script_alarm,
@@ -549,7 +576,7 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
             step_id="alarm_advanced",
             description_placeholders={
                 "alarm_name": alarm_name,
-                "info": "Configure advanced alarm settings. If 'Use Device Defaults' is enabled, the alarm will use the device-level default scripts configured in Settings → Default Scripts.",
+                "info": _ADVANCED_INFO_TEXT,
             },
             data_schema=self._build_advanced_schema(use_defaults),
         )
@@ -568,10 +595,9 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
             self._alarm_data = {"selected_alarm": user_input["alarm"]}
             return await self.async_step_alarm_actions()
 
+        option = selector.SelectOptionDict
         alarm_options = [
-            selector.SelectOptionDict(
-                value=alarm_id, label=f"{alarm.data.name} ({alarm.data.time})"
-            )
+            option(value=alarm_id, label=f"{alarm.data.name} ({alarm.data.time})")
             for alarm_id, alarm in coordinator.alarms.items()
         ]
 
@@ -582,7 +608,7 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
                     vol.Required("alarm"): selector.SelectSelector(
                         selector.SelectSelectorConfig(
                             options=alarm_options,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
+                            mode=_MANAGE_ALARMS_MODE,
                         )
                     ),
                 }
@@ -640,8 +666,8 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
 
         if user_input is not None:
             # Check if use_device_defaults toggle was changed
-            current_use_defaults = user_input.get(CONF_USE_DEVICE_DEFAULTS, True)
             previous_use_defaults = alarm.data.use_device_defaults
+            current_use_defaults = user_input.get(CONF_USE_DEVICE_DEFAULTS, previous_use_defaults)
 
             if current_use_defaults != previous_use_defaults:
                 # Toggle changed - update alarm data temporarily and re-show form with new schema
@@ -651,7 +677,7 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
                     step_id="edit_alarm",
                     description_placeholders={
                         "alarm_name": alarm.data.name,
-                        "info": "Edit alarm settings. If 'Use Device Defaults' is enabled, the alarm will use the device-level default scripts configured in Settings → Default Scripts.",
+                        "info": _EDIT_INFO_TEXT,
                     },
                     data_schema=self._build_edit_alarm_schema(alarm, current_use_defaults),
                 )
@@ -671,97 +697,56 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
                 _LOGGER.debug("Time validation failed: %s", err)
                 errors[CONF_ALARM_TIME] = "invalid_time"
 
-            # Validate numeric fields
-            numeric_validations = {
-                CONF_SNOOZE_DURATION: (1, 60),
-                CONF_MAX_SNOOZE_COUNT: (0, 10),
-                CONF_AUTO_DISMISS_TIMEOUT: (1, 180),
-                CONF_PRE_ALARM_DURATION: (0, 60),
-                CONF_SCRIPT_TIMEOUT: (1, 300),
-                CONF_SCRIPT_RETRY_COUNT: (0, 10),
-            }
-
-            for field, (min_val, max_val) in numeric_validations.items():
-                if field in user_input:
-                    try:
-                        user_input[field] = validate_duration(
-                            user_input[field], field, min_val, max_val
-                        )
-                    except ValidationError as err:
-                        _LOGGER.debug("Validation failed for %s: %s", field, err)
-                        errors[field] = "invalid_value"
-
+            # Numeric fields were already range-checked and coerced by the schema
             if errors:
                 # Re-show form with errors
-                use_defaults = user_input.get(CONF_USE_DEVICE_DEFAULTS, True)
                 return self.async_show_form(
                     step_id="edit_alarm",
                     description_placeholders={
                         "alarm_name": alarm.data.name,
-                        "info": "Edit alarm settings. If 'Use Device Defaults' is enabled, the alarm will use the device-level default scripts configured in Settings → Default Scripts.",
+                        "info": _EDIT_INFO_TEXT,
                     },
-                    data_schema=self._build_edit_alarm_schema(alarm, use_defaults),
+                    data_schema=self._build_edit_alarm_schema(alarm, current_use_defaults),
                     errors=errors,
                 )
 
             # Update alarm with validated values
+            previous_data = alarm.data.to_dict()
             alarm.data.name = validated_name
             alarm.data.time = time_str
-            alarm.data.days = user_input.get(CONF_DAYS, alarm.data.days)
-            alarm.data.snooze_duration = user_input.get(
-                CONF_SNOOZE_DURATION, alarm.data.snooze_duration
-            )
-            alarm.data.max_snooze_count = user_input.get(
-                CONF_MAX_SNOOZE_COUNT, alarm.data.max_snooze_count
-            )
-            alarm.data.auto_dismiss_timeout = user_input.get(
-                CONF_AUTO_DISMISS_TIMEOUT, alarm.data.auto_dismiss_timeout
-            )
-            alarm.data.pre_alarm_duration = user_input.get(
-                CONF_PRE_ALARM_DURATION, alarm.data.pre_alarm_duration
-            )
+            # Fields left out of the submission keep their current value
+            for conf_key, attr in _EDITABLE_FIELD_MAP.items():
+                if conf_key in user_input:
+                    setattr(alarm.data, attr, user_input[conf_key])
 
             # Update script settings
-            use_device_defaults = user_input.get(CONF_USE_DEVICE_DEFAULTS, True)
-            alarm.data.use_device_defaults = use_device_defaults
+            alarm.data.use_device_defaults = current_use_defaults
 
             # If using device defaults, clear individual scripts
             # The coordinator will use device-level defaults instead
-            if use_device_defaults:
-                alarm.data.script_pre_alarm = None
-                alarm.data.script_alarm = None
-                alarm.data.script_post_alarm = None
-                alarm.data.script_on_snooze = None
-                alarm.data.script_on_dismiss = None
-                alarm.data.script_on_arm = None
-                alarm.data.script_on_cancel = None
-                alarm.data.script_on_skip = None
-                alarm.data.script_fallback = None
+            if current_use_defaults:
+                for attr in _SCRIPT_FIELD_MAP.values():
+                    setattr(alarm.data, attr, None)
                 alarm.data.script_timeout = DEFAULT_SCRIPT_TIMEOUT
                 alarm.data.script_retry_count = DEFAULT_SCRIPT_RETRY_COUNT
             else:
                 # Update alarm-specific scripts from form
-                alarm.data.script_pre_alarm = user_input.get(CONF_SCRIPT_PRE_ALARM)
-                alarm.data.script_alarm = user_input.get(CONF_SCRIPT_ALARM)
-                alarm.data.script_post_alarm = user_input.get(CONF_SCRIPT_POST_ALARM)
-                alarm.data.script_on_snooze = user_input.get(CONF_SCRIPT_ON_SNOOZE)
-                alarm.data.script_on_dismiss = user_input.get(CONF_SCRIPT_ON_DISMISS)
-                alarm.data.script_on_arm = user_input.get(CONF_SCRIPT_ON_ARM)
-                alarm.data.script_on_cancel = user_input.get(CONF_SCRIPT_ON_CANCEL)
-                alarm.data.script_on_skip = user_input.get(CONF_SCRIPT_ON_SKIP)
-                alarm.data.script_fallback = user_input.get(CONF_SCRIPT_FALLBACK)
+                for conf_key, attr in _SCRIPT_FIELD_MAP.items():
+                    setattr(alarm.data, attr, user_input.get(conf_key))
                 alarm.data.script_timeout = user_input.get(
-                    CONF_SCRIPT_TIMEOUT, DEFAULT_SCRIPT_TIMEOUT
+                    CONF_SCRIPT_TIMEOUT, alarm.data.script_timeout
                 )
                 alarm.data.script_retry_count = user_input.get(
-                    CONF_SCRIPT_RETRY_COUNT, DEFAULT_SCRIPT_RETRY_COUNT
+                    CONF_SCRIPT_RETRY_COUNT, alarm.data.script_retry_count
                 )
 
-            try:
-                await coordinator.async_update_alarm(alarm.data)
-            except Exception as err:
-                _LOGGER.error("Error updating alarm: %s", err, exc_info=True)
-                return self.async_abort(reason="update_alarm_failed")
+            # Skip the storage write and reschedule when nothing was changed
+            if alarm.data.to_dict() != previous_data:
+                try:
+                    await coordinator.async_update_alarm(alarm.data)
+                except Exception as err:
+                    _LOGGER.error("Error updating alarm: %s", err, exc_info=True)
+                    return self.async_abort(reason="update_alarm_failed")
             return self.async_create_entry(title="", data={})
 
         # Show form with current alarm data
@@ -769,7 +754,7 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
             step_id="edit_alarm",
             description_placeholders={
                 "alarm_name": alarm.data.name,
-                "info": "Edit alarm settings. If 'Use Device Defaults' is enabled, the alarm will use the device-level default scripts configured in Settings → Default Scripts.",
+                "info": _EDIT_INFO_TEXT,
             },
             data_schema=self._build_edit_alarm_schema(alarm),
         )
@@ -782,141 +767,40 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
             # Build updated options, removing cleared default script fields
             # When a field is cleared, it won't be in user_input, so we need to
             # explicitly remove it from the saved options
-            updated_options = {
-                k: v
-                for k, v in self.config_entry.options.items()
-                if not k.startswith("default_script_")
-            }
-            # Add the new values from user_input, but filter out empty strings and None
-            # Empty strings occur when a user clears a previously set script field
-            for key, value in user_input.items():
-                if value is not None and value != "":
-                    updated_options[key] = value
-
-            # Save to config entry options
-            self.hass.config_entries.async_update_entry(
-                self.config_entry,
-                options=updated_options,
+            # New values from user_input are merged in, filtering out empty strings
+            # and None (empty strings occur when a user clears a previously set field)
+            updated_options = dict(self.config_entry.options)
+            for key in CONF_DEFAULT_SCRIPT_KEYS:
+                updated_options.pop(key, None)
+            updated_options.update(
+                (k, v) for k, v in user_input.items() if v is not None and v != ""
             )
+
+            # Save to config entry options, unless the submit changed nothing
+            if updated_options != self.config_entry.options:
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry,
+                    options=updated_options,
+                )
             return self.async_create_entry(title="", data={})
 
         # Get current defaults from options
         # Filter out empty strings from stored values (legacy data cleanup)
-        def get_option(key: str, default: Any = None) -> Any:
-            """Get option value, treating empty strings as None."""
-            value = self.config_entry.options.get(key, default)
-            return None if value == "" else value
+        options = self.config_entry.options
+        suggested = {
+            key: value
+            for key in CONF_DEFAULT_SCRIPT_KEYS
+            if (value := options.get(key)) is not None and value != ""
+        }
+        suggested.setdefault(CONF_DEFAULT_SCRIPT_TIMEOUT, DEFAULT_SCRIPT_TIMEOUT)
+        suggested.setdefault(CONF_DEFAULT_SCRIPT_RETRY_COUNT, DEFAULT_SCRIPT_RETRY_COUNT)
 
         return self.async_show_form(
             step_id="default_scripts",
             description_placeholders={
-                "info": "Configure default scripts that will be used by all alarms with 'Use Device Defaults' enabled. These scripts apply automatically to new alarms.",
+                "info": _DEFAULT_SCRIPTS_INFO_TEXT,
             },
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_DEFAULT_SCRIPT_PRE_ALARM,
-                        description={"suggested_value": get_option(CONF_DEFAULT_SCRIPT_PRE_ALARM)},
-                    ): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="script",
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_DEFAULT_SCRIPT_ALARM,
-                        description={"suggested_value": get_option(CONF_DEFAULT_SCRIPT_ALARM)},
-                    ): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="script",
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_DEFAULT_SCRIPT_POST_ALARM,
-                        description={"suggested_value": get_option(CONF_DEFAULT_SCRIPT_POST_ALARM)},
-                    ): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="script",
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_DEFAULT_SCRIPT_ON_SNOOZE,
-                        description={"suggested_value": get_option(CONF_DEFAULT_SCRIPT_ON_SNOOZE)},
-                    ): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="script",
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_DEFAULT_SCRIPT_ON_DISMISS,
-                        description={"suggested_value": get_option(CONF_DEFAULT_SCRIPT_ON_DISMISS)},
-                    ): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="script",
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_DEFAULT_SCRIPT_ON_ARM,
-                        description={"suggested_value": get_option(CONF_DEFAULT_SCRIPT_ON_ARM)},
-                    ): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="script",
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_DEFAULT_SCRIPT_ON_CANCEL,
-                        description={"suggested_value": get_option(CONF_DEFAULT_SCRIPT_ON_CANCEL)},
-                    ): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="script",
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_DEFAULT_SCRIPT_ON_SKIP,
-                        description={"suggested_value": get_option(CONF_DEFAULT_SCRIPT_ON_SKIP)},
-                    ): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="script",
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_DEFAULT_SCRIPT_FALLBACK,
-                        description={"suggested_value": get_option(CONF_DEFAULT_SCRIPT_FALLBACK)},
-                    ): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="script",
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_DEFAULT_SCRIPT_TIMEOUT,
-                        description={
-                            "suggested_value": get_option(
-                                CONF_DEFAULT_SCRIPT_TIMEOUT, DEFAULT_SCRIPT_TIMEOUT
-                            )
-                        },
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1,
-                            max=300,
-                            step=1,
-                            unit_of_measurement="seconds",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_DEFAULT_SCRIPT_RETRY_COUNT,
-                        description={
-                            "suggested_value": get_option(
-                                CONF_DEFAULT_SCRIPT_RETRY_COUNT,
-                                DEFAULT_SCRIPT_RETRY_COUNT,
-                            )
-                        },
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0, max=10, step=1, mode=selector.NumberSelectorMode.BOX
-                        )
-                    ),
-                }
-            ),
+            data_schema=self.add_suggested_values_to_schema(_DEFAULT_SCRIPTS_SCHEMA, suggested),
         )
 
     async def async_step_global_settings(
@@ -941,21 +825,13 @@ class AlarmClockOptionsFlow(config_entries.OptionsFlow):
                         default=current_settings.get(
                             CONF_WATCHDOG_TIMEOUT, DEFAULT_WATCHDOG_TIMEOUT
                         ),
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=10, max=300, step=10, unit_of_measurement="seconds"
-                        )
-                    ),
+                    ): vol.All(_WATCHDOG_TIMEOUT_SELECTOR, vol.Coerce(int)),
                     vol.Optional(
                         CONF_MISSED_ALARM_GRACE_PERIOD,
                         default=current_settings.get(
                             CONF_MISSED_ALARM_GRACE_PERIOD, DEFAULT_MISSED_ALARM_GRACE_PERIOD
                         ),
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1, max=60, step=1, unit_of_measurement="minutes"
-                        )
-                    ),
+                    ): vol.All(_MISSED_ALARM_GRACE_PERIOD_SELECTOR, vol.Coerce(int)),
                 }
             ),
         )
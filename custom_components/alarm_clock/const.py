@@ -51,6 +51,23 @@ CONF_DEFAULT_SCRIPT_FALLBACK: Final = "default_script_fallback"
 CONF_DEFAULT_SCRIPT_TIMEOUT: Final = "default_script_timeout"
 CONF_DEFAULT_SCRIPT_RETRY_COUNT: Final = "default_script_retry_count"
 
+# Every device-level default script option, all edited together in the options flow
+CONF_DEFAULT_SCRIPT_KEYS: Final = frozenset(
+    {
+        CONF_DEFAULT_SCRIPT_PRE_ALARM,
+        CONF_DEFAULT_SCRIPT_ALARM,
+        CONF_DEFAULT_SCRIPT_POST_ALARM,
+        CONF_DEFAULT_SCRIPT_ON_SNOOZE,
+        CONF_DEFAULT_SCRIPT_ON_DISMISS,
+        CONF_DEFAULT_SCRIPT_ON_ARM,
+        CONF_DEFAULT_SCRIPT_ON_CANCEL,
+        CONF_DEFAULT_SCRIPT_ON_SKIP,
+        CONF_DEFAULT_SCRIPT_FALLBACK,
+        CONF_DEFAULT_SCRIPT_TIMEOUT,
+        CONF_DEFAULT_SCRIPT_RETRY_COUNT,
+    }
+)
+
 # Reliability configuration
 CONF_WATCHDOG_TIMEOUT: Final = "watchdog_timeout"
 CONF_MISSED_ALARM_GRACE_PERIOD: Final = "missed_alarm_grace_period"
@@ -104,6 +121,11 @@ class MissedAlarmAction(StrEnum):
     SKIP = "skip"
 
 
+# States in which an alarm is active (about to ring, ringing or snoozed)
+ACTIVE_ALARM_STATES: Final = frozenset(
+    {AlarmState.PRE_ALARM, AlarmState.RINGING, AlarmState.SNOOZED}
+)
+
 # Valid state transitions
 VALID_STATE_TRANSITIONS: Final[dict[AlarmState, list[AlarmState]]] = {
     AlarmState.DISABLED: [AlarmState.ARMED],
@@ -15,10 +15,12 @@ import voluptuous as vol
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import CALLBACK_TYPE, ServiceCall
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    ACTIVE_ALARM_STATES,
     ATTR_ALARM_ID,
     ATTR_ALARM_TIME,
     ATTR_DAYS,
@@ -99,6 +101,10 @@ class AlarmClockCoordinator:
 
         self._update_callbacks: list[Callable] = []
         self._entity_adder_callbacks: list[Callable[[str], None]] = []
+
+        # IDs of alarms in ACTIVE_ALARM_STATES, kept in sync on every transition
+        self._active_alarm_ids: set[str] = set()
+
         self._running = False
         self._health_status: dict[str, Any] = {
             "healthy": True,
@@ -121,16 +127,35 @@ class AlarmClockCoordinator:
         # Track if this coordinator registered the services
         self._services_registered = False
 
+        # Device info shared by all entities of this config entry
+        self._device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title or "Alarm Clock",
+            manufacturer="Custom Integration",
+            model="Smart Alarm Clock",
+            sw_version="1.0.0",
+        )
+
     @property
     def alarms(self) -> dict[str, AlarmStateMachine]:
         """Get all alarms."""
         return self._alarms
 
+    @property
+    def active_alarm_ids(self) -> set[str]:
+        """Get the IDs of alarms that are about to ring, ringing or snoozed."""
+        return self._active_alarm_ids
+
     @property
     def health_status(self) -> dict[str, Any]:
         """Get health status."""
         return self._health_status
 
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Get the device info shared by all entities."""
+        return self._device_info
+
     async def async_start(self) -> None:
         """Start the coordinator."""
         _LOGGER.info("Starting alarm clock coordinator")
@@ -263,6 +288,7 @@ class AlarmClockCoordinator:
                     # State machine will use default state
 
             self._alarms[alarm_data.alarm_id] = alarm
+            self._track_active_state(alarm_data.alarm_id, alarm.state)
 
             # Schedule if armed
             if alarm.state == AlarmState.ARMED:
@@ -360,12 +386,17 @@ class AlarmClockCoordinator:
             # Remove associated entities from entity registry
             try:
                 entity_registry = er.async_get(self.hass)
-                entities_to_remove = []
 
-                # Find all entities with this alarm_id in their unique_id
-                for entity_id, entity_entry in entity_registry.entities.items():
-                    if entity_entry.unique_id and alarm_id in entity_entry.unique_id:
-                        entities_to_remove.append(entity_id)
+                # Only this entry's entities, matched on the full alarm prefix so
+                # alarm_1 never matches alarm_10 (covers disabled entities too)
+                unique_id_prefix = f"{self.entry.entry_id}_{alarm_id}_"
+                entities_to_remove = [
+                    entity_entry.entity_id
+                    for entity_entry in er.async_entries_for_config_entry(
+                        entity_registry, self.entry.entry_id
+                    )
+                    if entity_entry.unique_id.startswith(unique_id_prefix)
+                ]
 
                 # Remove found entities
                 for entity_id in entities_to_remove:
@@ -378,6 +409,7 @@ class AlarmClockCoordinator:
 
             # Remove from memory
             del self._alarms[alarm_id]
+            self._active_alarm_ids.discard(alarm_id)
 
             self._notify_update()
             _LOGGER.info(
@@ -1309,6 +1341,14 @@ class AlarmClockCoordinator:
             old_state,
             new_state,
         )
+        self._track_active_state(alarm_id, new_state)
+
+    def _track_active_state(self, alarm_id: str, state: AlarmState) -> None:
+        """Add or remove an alarm from the active alarm IDs."""
+        if state in ACTIVE_ALARM_STATES:
+            self._active_alarm_ids.add(alarm_id)
+        else:
+            self._active_alarm_ids.discard(alarm_id)
 
     def _cancel_scheduled_callback(self, alarm_id: str) -> None:
         """Cancel scheduled alarm callback."""
@@ -12,7 +12,8 @@ from .const import DOMAIN
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
 
-TO_REDACT = {
+# Script fields included (redacted) in the per-alarm diagnostics
+_SCRIPT_KEYS = (
     "script_pre_alarm",
     "script_alarm",
     "script_post_alarm",
@@ -22,7 +23,9 @@ TO_REDACT = {
     "script_on_cancel",
     "script_on_skip",
     "script_fallback",
-}
+)
+
+TO_REDACT: frozenset[str] = frozenset(_SCRIPT_KEYS)
 
 
 async def async_get_config_entry_diagnostics(
@@ -36,34 +39,25 @@ async def async_get_config_entry_diagnostics(
 
     alarms_data = []
     for alarm_id, alarm in coordinator.alarms.items():
+        data = alarm.data
         alarm_info = {
             "alarm_id": alarm_id,
-            "name": alarm.data.name,
-            "time": alarm.data.time,
-            "enabled": alarm.data.enabled,
-            "days": alarm.data.days,
-            "one_time": alarm.data.one_time,
-            "skip_next": alarm.data.skip_next,
-            "snooze_duration": alarm.data.snooze_duration,
-            "max_snooze_count": alarm.data.max_snooze_count,
-            "auto_dismiss_timeout": alarm.data.auto_dismiss_timeout,
-            "pre_alarm_duration": alarm.data.pre_alarm_duration,
+            "name": data.name,
+            "time": data.time,
+            "enabled": data.enabled,
+            "days": data.days,
+            "one_time": data.one_time,
+            "skip_next": data.skip_next,
+            "snooze_duration": data.snooze_duration,
+            "max_snooze_count": data.max_snooze_count,
+            "auto_dismiss_timeout": data.auto_dismiss_timeout,
+            "pre_alarm_duration": data.pre_alarm_duration,
             "state": alarm.state.value,
             "snooze_count": alarm.snooze_count,
             "next_trigger": (alarm.next_trigger.isoformat() if alarm.next_trigger else None),
             "last_triggered": (alarm.last_triggered.isoformat() if alarm.last_triggered else None),
             "scripts": async_redact_data(
-                {
-                    "script_pre_alarm": alarm.data.script_pre_alarm,
-                    "script_alarm": alarm.data.script_alarm,
-                    "script_post_alarm": alarm.data.script_post_alarm,
-                    "script_on_snooze": alarm.data.script_on_snooze,
-                    "script_on_dismiss": alarm.data.script_on_dismiss,
-                    "script_on_arm": alarm.data.script_on_arm,
-                    "script_on_cancel": alarm.data.script_on_cancel,
-                    "script_on_skip": alarm.data.script_on_skip,
-                    "script_fallback": alarm.data.script_fallback,
-                },
+                {key: getattr(data, key) for key in _SCRIPT_KEYS},
                 TO_REDACT,
             ),
         }
@@ -5,12 +5,9 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN
-
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
 
@@ -37,22 +34,16 @@ class AlarmClockEntity(RestoreEntity):
         self.entry = entry
         self._alarm = alarm
         self._alarm_id = alarm.data.alarm_id  # Cache the ID for safety
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=entry.title or "Alarm Clock",
-            manufacturer="Custom Integration",
-            model="Smart Alarm Clock",
-            sw_version="1.0.0",
-        )
+        # Unique IDs of per-alarm entities are {entry_id}_{alarm_id}_{entity_type}
+        self._unique_id_prefix = f"{entry.entry_id}_{self._alarm_id}"
+        self._attr_device_info = coordinator.device_info
 
     @property
     def alarm(self) -> AlarmStateMachine | None:
         """Return the alarm state machine, or None if no longer available."""
-        # Prefer the live version from coordinator if available
-        if self._alarm_id in self.coordinator.alarms:
-            return self.coordinator.alarms[self._alarm_id]
-        # Fall back to cached reference (may be stale but prevents crashes)
-        return self._alarm
+        # Prefer the live version from coordinator if available, falling back to
+        # the cached reference (may be stale but prevents crashes)
+        return self.coordinator.alarms.get(self._alarm_id, self._alarm)
 
     @property
     def alarm_id(self) -> str:
@@ -95,13 +86,7 @@ class AlarmClockDeviceEntity(Entity):
         """Initialize the entity."""
         self.coordinator = coordinator
         self.entry = entry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=entry.title or "Alarm Clock",
-            manufacturer="Custom Integration",
-            model="Smart Alarm Clock",
-            sw_version="1.0.0",
-        )
+        self._attr_device_info = coordinator.device_info
 
     async def async_added_to_hass(self) -> None:
         """Handle entity added to Home Assistant."""
@@ -24,6 +24,18 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Icon for each alarm state, shared by all state sensors
+_STATE_ICONS: dict[AlarmState, str] = {
+    AlarmState.DISABLED: "mdi:alarm-off",
+    AlarmState.ARMED: "mdi:alarm",
+    AlarmState.PRE_ALARM: "mdi:alarm-note",
+    AlarmState.RINGING: "mdi:alarm-light",
+    AlarmState.SNOOZED: "mdi:alarm-snooze",
+    AlarmState.DISMISSED: "mdi:alarm-check",
+    AlarmState.AUTO_DISMISSED: "mdi:alarm-check",
+    AlarmState.MISSED: "mdi:alarm-multiple",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -77,7 +89,7 @@ class AlarmStateSensor(AlarmClockEntity, SensorEntity):
     def __init__(self, coordinator, entry, alarm) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, alarm)
-        self._attr_unique_id = f"{entry.entry_id}_{alarm.data.alarm_id}_state"
+        self._attr_unique_id = f"{self._unique_id_prefix}_state"
         self._attr_name = f"{alarm.data.name} State"
 
     @property
@@ -94,17 +106,7 @@ class AlarmStateSensor(AlarmClockEntity, SensorEntity):
         alarm = self.alarm
         if alarm is None:
             return "mdi:alarm-off"
-        icons = {
-            AlarmState.DISABLED: "mdi:alarm-off",
-            AlarmState.ARMED: "mdi:alarm",
-            AlarmState.PRE_ALARM: "mdi:alarm-note",
-            AlarmState.RINGING: "mdi:alarm-light",
-            AlarmState.SNOOZED: "mdi:alarm-snooze",
-            AlarmState.DISMISSED: "mdi:alarm-check",
-            AlarmState.AUTO_DISMISSED: "mdi:alarm-check",
-            AlarmState.MISSED: "mdi:alarm-multiple",
-        }
-        return icons.get(alarm.state, "mdi:alarm")
+        return _STATE_ICONS.get(alarm.state, "mdi:alarm")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -132,7 +134,7 @@ class AlarmNextTriggerSensor(AlarmClockEntity, SensorEntity):
     def __init__(self, coordinator, entry, alarm) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, alarm)
-        self._attr_unique_id = f"{entry.entry_id}_{alarm.data.alarm_id}_next_trigger"
+        self._attr_unique_id = f"{self._unique_id_prefix}_next_trigger"
         self._attr_name = f"{alarm.data.name} Next Trigger"
 
     @property
@@ -174,7 +176,7 @@ class AlarmSnoozeCountSensor(AlarmClockEntity, SensorEntity):
     def __init__(self, coordinator, entry, alarm) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, alarm)
-        self._attr_unique_id = f"{entry.entry_id}_{alarm.data.alarm_id}_snooze_count"
+        self._attr_unique_id = f"{self._unique_id_prefix}_snooze_count"
         self._attr_name = f"{alarm.data.name} Snooze Count"
 
     @property
@@ -272,35 +274,27 @@ class ActiveAlarmCountSensor(AlarmClockDeviceEntity, SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the count of active alarms."""
-        return sum(
-            1
-            for a in self.coordinator.alarms.values()
-            if a.state in (AlarmState.RINGING, AlarmState.SNOOZED, AlarmState.PRE_ALARM)
-        )
+        return len(self.coordinator.active_alarm_ids)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
+        # Same source as native_value, so the count and the list never disagree
+        active_ids = self.coordinator.active_alarm_ids
+        active = [a for a in self.coordinator.alarms.values() if a.data.alarm_id in active_ids]
         active_alarms = [
             {
                 "alarm_id": a.data.alarm_id,
                 "alarm_name": a.data.name,
                 "state": a.state.value,
             }
-            for a in self.coordinator.alarms.values()
-            if a.state in (AlarmState.RINGING, AlarmState.SNOOZED, AlarmState.PRE_ALARM)
+            for a in active
         ]
 
         return {
             "entry_id": self.entry.entry_id,
-            "ringing": sum(
-                1 for a in self.coordinator.alarms.values() if a.state == AlarmState.RINGING
-            ),
-            "snoozed": sum(
-                1 for a in self.coordinator.alarms.values() if a.state == AlarmState.SNOOZED
-            ),
-            "pre_alarm": sum(
-                1 for a in self.coordinator.alarms.values() if a.state == AlarmState.PRE_ALARM
-            ),
+            "ringing": sum(1 for a in active if a.state == AlarmState.RINGING),
+            "snoozed": sum(1 for a in active if a.state == AlarmState.SNOOZED),
+            "pre_alarm": sum(1 for a in active if a.state == AlarmState.PRE_ALARM),
             "active_alarms": active_alarms,
         }
@@ -11,6 +11,8 @@ from .const import STORE_KEY, STORE_VERSION
 from .state_machine import AlarmData
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
@@ -147,6 +149,10 @@ class AlarmClockStore:
         """Get all alarms as AlarmData objects."""
         return [AlarmData.from_dict(data) for data in self._data.get("alarms", {}).values()]
 
+    def iter_alarm_ids(self) -> Iterator[str]:
+        """Iterate over stored alarm IDs without building AlarmData objects."""
+        yield from self._data.get("alarms", {})
+
     async def async_clear_all(self) -> None:
         """Clear all stored data."""
         self._data = {
@@ -19,6 +19,13 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Icons for active alarms; other states fall back to the enabled flag
+_ACTIVE_ICONS: dict[AlarmState, str] = {
+    AlarmState.RINGING: "mdi:alarm-light",
+    AlarmState.SNOOZED: "mdi:alarm-snooze",
+    AlarmState.PRE_ALARM: "mdi:alarm-note",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -69,7 +76,7 @@ class AlarmEnableSwitch(AlarmClockEntity, SwitchEntity):
     def __init__(self, coordinator, entry, alarm) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, entry, alarm)
-        self._attr_unique_id = f"{entry.entry_id}_{alarm.data.alarm_id}_enable"
+        self._attr_unique_id = f"{self._unique_id_prefix}_enable"
         self._attr_name = f"{alarm.data.name}"
 
     @property
@@ -86,15 +93,9 @@ class AlarmEnableSwitch(AlarmClockEntity, SwitchEntity):
         alarm = self.alarm
         if alarm is None:
             return "mdi:alarm-off"
-        if alarm.state == AlarmState.RINGING:
-            return "mdi:alarm-light"
-        elif alarm.state == AlarmState.SNOOZED:
-            return "mdi:alarm-snooze"
-        elif alarm.state == AlarmState.PRE_ALARM:
-            return "mdi:alarm-note"
-        elif alarm.data.enabled:
-            return "mdi:alarm"
-        return "mdi:alarm-off"
+        if (icon := _ACTIVE_ICONS.get(alarm.state)) is not None:
+            return icon
+        return "mdi:alarm" if alarm.data.enabled else "mdi:alarm-off"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -153,7 +154,7 @@ class AlarmSkipNextSwitch(AlarmClockEntity, SwitchEntity):
     def __init__(self, coordinator, entry, alarm) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, entry, alarm)
-        self._attr_unique_id = f"{entry.entry_id}_{alarm.data.alarm_id}_skip_next"
+        self._attr_unique_id = f"{self._unique_id_prefix}_skip_next"
         self._attr_name = f"{alarm.data.name} Skip Next"
 
     @property
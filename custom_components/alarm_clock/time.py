@@ -65,7 +65,7 @@ class AlarmTimeEntity(AlarmClockEntity, TimeEntity):
     def __init__(self, coordinator, entry, alarm) -> None:
         """Initialize the time entity."""
         super().__init__(coordinator, entry, alarm)
-        self._attr_unique_id = f"{entry.entry_id}_{alarm.data.alarm_id}_time"
+        self._attr_unique_id = f"{self._unique_id_prefix}_time"
         self._attr_name = f"{alarm.data.name} Time"
 
     @property
@@ -1,62 +1,294 @@
 """Static code quality tests for alarm_clock integration."""
 
+import ast
+import os
 import re
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from functools import cache
 from pathlib import Path
 
+_ROOT = Path(__file__).resolve().parent.parent
+_BASE = _ROOT / "custom_components" / "alarm_clock"
+_COORDINATOR = _BASE / "coordinator.py"
+_INIT = _BASE / "__init__.py"
+_CONST = _BASE / "const.py"
+_STATE_MACHINE = _BASE / "state_machine.py"
+_CONFIG_FLOW = _BASE / "config_flow.py"
+_SERVICES_YAML = _BASE / "services.yaml"
+_ENTITY = _BASE / "entity.py"
+_ENTITY_FILES = [_BASE / f for f in ("switch.py", "sensor.py", "binary_sensor.py", "time.py")]
+_JS_FILES = [_BASE / "alarm-clock-card.js", _ROOT / "www" / "alarm-clock-card.js"]
+
+# Patterns are compiled once at import time and shared by every check below
+# Keyed by the named group each pattern gets in the fused per-file alternation;
+# "literal" is a fixed substring every match must contain, used as a cheap pre-filter
+_DEPRECATED_CHECKS = {
+    "dep_lovelace": {
+        "pattern": r"lovelace_data\.get\(['\"]resources['\"]\)",
+        "literal": "lovelace_data",
+        "message": "Deprecated: Use getattr(lovelace_data, 'resources', None) instead",
+        "files": ["__init__.py"],
+    },
+    "dep_add_job": {
+        "pattern": r"hass\.async_add_job\(",
+        "literal": "async_add_job",
+        "message": "Deprecated: Use call_soon_threadsafe + async_create_task instead",
+        "files": ["*.py"],
+    },
+    "warn_create_task": {
+        "pattern": r"async_create_task\([^)]+\)(?!\s*\))",
+        "literal": "async_create_task",
+        "message": "Warning: async_create_task should be wrapped in call_soon_threadsafe",
+        "files": ["coordinator.py"],
+        "ignore_if_has": "call_soon_threadsafe",
+    },
+}
+
+_ASYNC_CREATE_TASK_RE = re.compile(r"async_create_task\s*\(")
+
+_UNSAFE_CALLBACK_RES = [
+    (re.compile(pattern), operation)
+    for pattern, operation in (
+        (r"self\._update_callbacks\.append\(", "append to _update_callbacks"),
+        (r"self\._update_callbacks\.remove\(", "remove from _update_callbacks"),
+        (r"self\._update_callbacks\.clear\(", "clear _update_callbacks"),
+        (r"self\._entity_adder_callbacks\.append\(", "append to _entity_adder_callbacks"),
+        (r"self\._entity_adder_callbacks\.clear\(", "clear _entity_adder_callbacks"),
+    )
+]
+
+# A method body runs from its def line to the next method or class definition
+_METHOD_END_MARKERS = ("\n    async def ", "\n    def ", "\nclass ")
+
+# Properties that access self.alarm and need null checks
+_PROPERTIES_NEEDING_CHECKS = frozenset(
+    {
+        "is_on",
+        "native_value",
+        "icon",
+        "extra_state_attributes",
+        "available",
+    }
+)
+
+_BLOCKING_CALL_RE = re.compile(r"async_call\([^)]*blocking\s*=\s*True")
+
+# Modules that must only be imported at module level
+_MODULE_LEVEL_IMPORTS = ("uuid",)
+
+# Critical async methods that should have try/except
+_CRITICAL_METHODS = ("async_add_alarm", "async_update_alarm", "async_remove_alarm")
+
+# One pass over the card: the version declaration, any other CARD_VERSION
+# reference, and the removed _setViewMode method
+_JS_SCAN_RE = re.compile(
+    r'CARD_VERSION\s*=\s*["\'](?P<version>[^"\']+)["\']'
+    r"|(?P<version_ref>CARD_VERSION)"
+    r"|(?P<deprecated>_setViewMode)"
+)
+
+# Top-level keys of services.yaml are the service names
+_SERVICE_KEY_RE = re.compile(r"^([A-Za-z_]\w*):", re.MULTILINE)
+
+_DOMAIN_RE = re.compile(r'DOMAIN\s*(?::\s*Final\s*)?=\s*["\']([^"\']+)["\']')
+
+_CONFIG_FLOW_COORDINATOR_CALL_RES = [
+    re.compile(r"await coordinator\.async_add_alarm\("),
+    re.compile(r"await coordinator\.async_remove_alarm\("),
+    re.compile(r"await coordinator\.async_update_alarm\("),
+]
+
+
+@cache
+def _deprecated_pattern(check_names: tuple[str, ...]) -> re.Pattern[str]:
+    """Fuse the given deprecated-pattern checks into one named-group alternation."""
+    return re.compile(
+        "|".join(f"(?P<{name}>{_DEPRECATED_CHECKS[name]['pattern']})" for name in check_names)
+    )
+
+
+@cache
+def _newline_offsets(content: str) -> list[int]:
+    """Return the sorted offsets of every newline in content."""
+    return [match.start() for match in re.finditer("\n", content)]
+
+
+@cache
+def _parse(path: Path) -> ast.Module:
+    """Parse a source file once and share the tree between checks."""
+    return ast.parse(_read_text(path))
+
+
+def _functions(tree: ast.AST) -> list[ast.FunctionDef | ast.AsyncFunctionDef]:
+    """Return every (async) function definition in tree, nested ones included."""
+    return [
+        node for node in ast.walk(tree) if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+
+
+def _has_try(func: ast.AST) -> bool:
+    """Return True if func contains a try/except block."""
+    return any(isinstance(node, ast.Try) and node.handlers for node in ast.walk(func))
+
+
+def _is_self_alarm(node: ast.AST) -> bool:
+    """Return True if node is the expression ``self.alarm``."""
+    return (
+        isinstance(node, ast.Attribute)
+        and node.attr == "alarm"
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "self"
+    )
+
+
+def _has_alarm_null_check(func: ast.AST) -> bool:
+    """Return True if func tests self.alarm (directly or via a local) against None."""
+    binds_alarm = any(
+        isinstance(node, ast.Assign)
+        and _is_self_alarm(node.value)
+        and any(isinstance(target, ast.Name) and target.id == "alarm" for target in node.targets)
+        for node in ast.walk(func)
+    )
+    for node in ast.walk(func):
+        if not isinstance(node, (ast.If, ast.IfExp)):
+            continue
+        for cmp in ast.walk(node.test):
+            if not (
+                isinstance(cmp, ast.Compare)
+                and isinstance(cmp.ops[0], ast.Is)
+                and isinstance(cmp.comparators[0], ast.Constant)
+                and cmp.comparators[0].value is None
+            ):
+                continue
+            if _is_self_alarm(cmp.left):
+                return True
+            if binds_alarm and isinstance(cmp.left, ast.Name) and cmp.left.id == "alarm":
+                return True
+    return False
+
+
+def _method_block(
+    content: str, header: str, end_markers: tuple[str, ...] = _METHOD_END_MARKERS
+) -> tuple[int, str] | None:
+    """Return the offset and source of the block starting at header.
+
+    The block ends at the first end marker after the header, found with plain
+    str.find instead of a lazy DOTALL regex.
+    """
+    start = content.find(header)
+    if start == -1:
+        return None
+    body_start = start + len(header)
+    end = min(
+        (idx for marker in end_markers if (idx := content.find(marker, body_start)) != -1),
+        default=len(content),
+    )
+    return start, content[start:end]
+
+
+def _head(content: str, line_count: int) -> str:
+    """Return the first line_count lines of content without splitting the whole file."""
+    offsets = _newline_offsets(content)
+    return content[: offsets[line_count - 1]] if len(offsets) >= line_count else content
+
+
+@cache
+def _service_names() -> frozenset[str]:
+    """Return the services defined in services.yaml, parsed in a single pass."""
+    return frozenset(_SERVICE_KEY_RE.findall(_read_text(_SERVICES_YAML)))
+
+
+@dataclass(frozen=True)
+class _CoordinatorAnalysis:
+    """Facts about coordinator.py, computed once and shared by its checks."""
+
+    content: str
+    functions: tuple[ast.FunctionDef | ast.AsyncFunctionDef, ...]
+    has_threading_import: bool
+    has_callback_lock: bool
+    async_create_task_spans: tuple[tuple[int, int], ...]
+
+
+@cache
+def _analyze_coordinator() -> _CoordinatorAnalysis | None:
+    """Read, parse and pre-scan coordinator.py, or return None if it is missing."""
+    if not _COORDINATOR.exists():
+        return None
+    content = _read_text(_COORDINATOR)
+    return _CoordinatorAnalysis(
+        content=content,
+        functions=tuple(_functions(_parse(_COORDINATOR))),
+        has_threading_import="import threading" in content,
+        has_callback_lock="_callback_lock" in content,
+        async_create_task_spans=tuple(
+            match.span() for match in _ASYNC_CREATE_TASK_RE.finditer(content)
+        ),
+    )
+
+
+def _line_number(content: str, offset: int) -> int:
+    """Return the 1-based line number of offset within content."""
+    return bisect_left(_newline_offsets(content), offset) + 1
+
+
+@cache
+def _py_files() -> tuple[Path, ...]:
+    """List the integration's Python modules once; the tree doesn't change during a run."""
+    with os.scandir(_BASE) as it:
+        return tuple(
+            sorted(Path(entry.path) for entry in it if entry.name.endswith(".py") and entry.is_file())
+        )
+
+
+@cache
+def _read_text(path: Path) -> str:
+    """Read a source file once; the tree doesn't change during a run."""
+    return path.read_text() if path.exists() else ""
+
 
 def test_no_deprecated_patterns():
     """Test that code doesn't use deprecated Home Assistant patterns."""
     errors = []
-    base_path = Path(__file__).parent.parent / "custom_components" / "alarm_clock"
-
-    # Patterns to check
-    checks = [
-        {
-            "pattern": r"lovelace_data\.get\(['\"]resources['\"]\)",
-            "message": "Deprecated: Use getattr(lovelace_data, 'resources', None) instead",
-            "files": ["__init__.py"],
-        },
-        {
-            "pattern": r"hass\.async_add_job\(",
-            "message": "Deprecated: Use call_soon_threadsafe + async_create_task instead",
-            "files": ["*.py"],
-        },
-        {
-            "pattern": r"async_create_task\([^)]+\)(?!\s*\))",
-            "message": "Warning: async_create_task should be wrapped in call_soon_threadsafe",
-            "files": ["coordinator.py"],
-            "ignore_if_has": "call_soon_threadsafe",
-        },
-    ]
 
-    for check in checks:
-        pattern = check["pattern"]
-        message = check["message"]
-        file_patterns = check["files"]
-
-        for file_pattern in file_patterns:
+    # Partition checks by target file so each file is scanned exactly once
+    checks_by_file: dict[Path, list[str]] = {}
+    for name, check in _DEPRECATED_CHECKS.items():
+        for file_pattern in check["files"]:
             if "*" in file_pattern:
-                files = base_path.glob(file_pattern)
+                files = [path for path in _py_files() if fnmatch(path.name, file_pattern)]
             else:
-                files = [base_path / file_pattern]
+                files = [_BASE / file_pattern]
 
             for file_path in files:
-                if not file_path.exists():
-                    continue
+                checks_by_file.setdefault(file_path, []).append(name)
 
-                content = file_path.read_text()
+    for file_path, check_names in checks_by_file.items():
+        if not file_path.exists():
+            continue
 
-                # Skip if ignore condition is met
-                if "ignore_if_has" in check and check["ignore_if_has"] in content:
-                    continue
+        content = _read_text(file_path)
 
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    # Calculate line number
-                    line_num = content[: match.start()].count("\n") + 1
-                    errors.append(
-                        f"{file_path.name}:{line_num}: {message}\n  Found: {match.group()}"
-                    )
+        # Skip checks that can't match or whose ignore condition is met
+        active = tuple(
+            name
+            for name in dict.fromkeys(check_names)
+            if _DEPRECATED_CHECKS[name]["literal"] in content
+            and (
+                "ignore_if_has" not in _DEPRECATED_CHECKS[name]
+                or _DEPRECATED_CHECKS[name]["ignore_if_has"] not in content
+            )
+        )
+        if not active:
+            continue
+
+        for match in _deprecated_pattern(active).finditer(content):
+            message = _DEPRECATED_CHECKS[match.lastgroup]["message"]
+            # Calculate line number
+            line_num = _line_number(content, match.start())
+            errors.append(f"{file_path.name}:{line_num}: {message}\n  Found: {match.group()}")
 
     return errors
 
@@ -64,35 +296,22 @@ def test_no_deprecated_patterns():
 def test_thread_safety():
     """Test that thread safety patterns are properly implemented."""
     errors = []
-    coordinator_file = (
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "coordinator.py"
-    )
-
-    if not coordinator_file.exists():
+    if (analysis := _analyze_coordinator()) is None:
         return ["coordinator.py not found"]
 
-    content = coordinator_file.read_text()
-
-    # Check for async_create_task usage
-    async_create_task_pattern = r"async_create_task\s*\("
-    matches = list(re.finditer(async_create_task_pattern, content))
+    content = analysis.content
 
-    if matches:
-        # Ensure all are wrapped in call_soon_threadsafe
-        for match in matches:
-            # Get context around the match
-            start = max(0, match.start() - 200)
-            end = min(len(content), match.end() + 100)
-            context = content[start:end]
+    # Check for async_create_task usage; all must be wrapped in call_soon_threadsafe
+    for match_start, match_end in analysis.async_create_task_spans:
+        # Search the context around the match in place (no slice copy)
+        start = max(0, match_start - 200)
+        end = min(len(content), match_end + 100)
 
-            if "call_soon_threadsafe" not in context:
-                line_num = content[: match.start()].count("\n") + 1
-                errors.append(
-                    f"coordinator.py:{line_num}: async_create_task not wrapped in call_soon_threadsafe"
-                )
+        if content.find("call_soon_threadsafe", start, end) == -1:
+            line_num = _line_number(content, match_start)
+            errors.append(
+                f"coordinator.py:{line_num}: async_create_task not wrapped in call_soon_threadsafe"
+            )
 
     return errors
 
@@ -100,79 +319,47 @@ def test_thread_safety():
 def test_callback_thread_safety():
     """Test that callback list operations are thread-safe."""
     errors = []
-    coordinator_file = (
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "coordinator.py"
-    )
-
-    if not coordinator_file.exists():
+    if (analysis := _analyze_coordinator()) is None:
         return ["coordinator.py not found"]
 
-    content = coordinator_file.read_text()
+    content = analysis.content
 
     # Check that threading.Lock is imported
-    if "import threading" not in content:
+    if not analysis.has_threading_import:
         errors.append(
             "coordinator.py: Missing 'import threading' - needed for callback thread safety"
         )
         return errors
 
     # Check that _callback_lock is defined
-    if "_callback_lock" not in content:
+    if not analysis.has_callback_lock:
         errors.append(
             "coordinator.py: Missing '_callback_lock' - needed for thread-safe callback operations"
         )
 
     # Check that _update_callbacks operations use the lock
     # Look for patterns that modify _update_callbacks without lock
-    unsafe_patterns = [
-        (
-            r"self\._update_callbacks\.append\(",
-            "append to _update_callbacks",
-        ),
-        (
-            r"self\._update_callbacks\.remove\(",
-            "remove from _update_callbacks",
-        ),
-        (
-            r"self\._update_callbacks\.clear\(",
-            "clear _update_callbacks",
-        ),
-        (
-            r"self\._entity_adder_callbacks\.append\(",
-            "append to _entity_adder_callbacks",
-        ),
-        (
-            r"self\._entity_adder_callbacks\.clear\(",
-            "clear _entity_adder_callbacks",
-        ),
-    ]
-
-    for pattern, operation in unsafe_patterns:
-        matches = list(re.finditer(pattern, content))
-        for match in matches:
-            # Check if this is within a 'with self._callback_lock:' block
-            # Look backwards for the lock context
-            start = max(0, match.start() - 300)
-            context_before = content[start : match.start()]
-
-            # Count 'with self._callback_lock:' vs closing of blocks
-            if "with self._callback_lock:" not in context_before:
-                line_num = content[: match.start()].count("\n") + 1
-                errors.append(
-                    f"coordinator.py:{line_num}: {operation} without _callback_lock protection"
-                )
+    # Literal guard: skip the regex sweep when neither callback list is touched
+    if "_update_callbacks" in content or "_entity_adder_callbacks" in content:
+        for pattern, operation in _UNSAFE_CALLBACK_RES:
+            for match in pattern.finditer(content):
+                # Check if this is within a 'with self._callback_lock:' block
+                # Look backwards for the lock context
+                start = max(0, match.start() - 300)
+
+                # Count 'with self._callback_lock:' vs closing of blocks
+                if content.find("with self._callback_lock:", start, match.start()) == -1:
+                    line_num = _line_number(content, match.start())
+                    errors.append(
+                        f"coordinator.py:{line_num}: {operation} without _callback_lock protection"
+                    )
 
     # Check that _notify_update copies the list before iteration
-    notify_update_match = re.search(
-        r"def _notify_update\(self\).*?(?=\n    def |\nclass |\Z)",
-        content,
-        re.DOTALL,
+    notify_update_block = _method_block(
+        content, "def _notify_update(self)", ("\n    def ", "\nclass ")
     )
-    if notify_update_match:
-        notify_content = notify_update_match.group()
+    if notify_update_block:
+        _, notify_content = notify_update_block
         if "list(self._update_callbacks)" not in notify_content:
             if "callbacks = list(" not in notify_content:
                 errors.append(
@@ -185,56 +372,28 @@ def test_callback_thread_safety():
 def test_entity_null_checks():
     """Test that entity properties have null checks for self.alarm."""
     errors = []
-    entity_files = [
-        "switch.py",
-        "sensor.py",
-        "binary_sensor.py",
-        "time.py",
-    ]
-
-    base_path = Path(__file__).parent.parent / "custom_components" / "alarm_clock"
-
-    # Properties that access self.alarm and need null checks
-    properties_needing_checks = [
-        "is_on",
-        "native_value",
-        "icon",
-        "extra_state_attributes",
-        "available",
-    ]
-
-    for filename in entity_files:
-        file_path = base_path / filename
+    for file_path in _ENTITY_FILES:
         if not file_path.exists():
             continue
-
-        content = file_path.read_text()
+        filename = file_path.name
 
         # Find all property definitions that access self.alarm
-        for prop_name in properties_needing_checks:
-            # Find property definition
-            prop_pattern = rf"@property\s+def {prop_name}\(self\).*?(?=@property|\n    async def |\n    def |\nclass |\Z)"
-            matches = re.finditer(prop_pattern, content, re.DOTALL)
-
-            for match in matches:
-                prop_content = match.group()
-
-                # Check if it accesses self.alarm
-                if "self.alarm" in prop_content:
-                    # Check for null check pattern: "alarm = self.alarm" followed by "if alarm is None"
-                    has_null_check = (
-                        "alarm = self.alarm" in prop_content
-                        and "if alarm is None" in prop_content
-                    )
-
-                    # Also accept direct pattern with early return
-                    has_direct_check = "if self.alarm is None" in prop_content
-
-                    if not has_null_check and not has_direct_check:
-                        line_num = content[: match.start()].count("\n") + 1
-                        errors.append(
-                            f"{filename}:{line_num}: Property '{prop_name}' accesses self.alarm without null check"
-                        )
+        for func in _functions(_parse(file_path)):
+            if func.name not in _PROPERTIES_NEEDING_CHECKS or not any(
+                isinstance(decorator, ast.Name) and decorator.id == "property"
+                for decorator in func.decorator_list
+            ):
+                continue
+
+            # Check if it accesses self.alarm without guarding against None
+            if not any(_is_self_alarm(node) for node in ast.walk(func)):
+                continue
+
+            if not _has_alarm_null_check(func):
+                line_num = func.decorator_list[0].lineno
+                errors.append(
+                    f"{filename}:{line_num}: Property '{func.name}' accesses self.alarm without null check"
+                )
 
     return errors
 
@@ -242,31 +401,18 @@ def test_entity_null_checks():
 def test_service_handler_exception_handling():
     """Test that service handlers have exception handling."""
     errors = []
-    coordinator_file = (
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "coordinator.py"
-    )
-
-    if not coordinator_file.exists():
+    if (analysis := _analyze_coordinator()) is None:
         return ["coordinator.py not found"]
 
-    content = coordinator_file.read_text()
-
     # Find all service handler definitions
-    handler_pattern = r"async def (handle_\w+)\(call: ServiceCall\).*?(?=\n        async def |\n    async def |\n    def |\n        # Register|\Z)"
-    matches = re.finditer(handler_pattern, content, re.DOTALL)
-
-    for match in matches:
-        handler_name = match.group(1)
-        handler_content = match.group()
+    for func in analysis.functions:
+        if not isinstance(func, ast.AsyncFunctionDef) or not func.name.startswith("handle_"):
+            continue
 
         # Check for try/except block
-        if "try:" not in handler_content or "except" not in handler_content:
-            line_num = content[: match.start()].count("\n") + 1
+        if not _has_try(func):
             errors.append(
-                f"coordinator.py:{line_num}: Service handler '{handler_name}' missing exception handling"
+                f"coordinator.py:{func.lineno}: Service handler '{func.name}' missing exception handling"
             )
 
     return errors
@@ -275,24 +421,16 @@ def test_service_handler_exception_handling():
 def test_no_blocking_service_calls():
     """Test that service calls don't use blocking=True (can block event loop)."""
     errors = []
-    coordinator_file = (
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "coordinator.py"
-    )
-
-    if not coordinator_file.exists():
+    if (analysis := _analyze_coordinator()) is None:
         return ["coordinator.py not found"]
 
-    content = coordinator_file.read_text()
+    content = analysis.content
+    if "blocking" not in content:
+        return errors
 
     # Find blocking=True in service calls
-    blocking_pattern = r"async_call\([^)]*blocking\s*=\s*True"
-    matches = list(re.finditer(blocking_pattern, content, re.DOTALL))
-
-    for match in matches:
-        line_num = content[: match.start()].count("\n") + 1
+    for match in _BLOCKING_CALL_RE.finditer(content):
+        line_num = _line_number(content, match.start())
         errors.append(
             f"coordinator.py:{line_num}: Service call with blocking=True can block event loop during startup"
         )
@@ -303,35 +441,30 @@ def test_no_blocking_service_calls():
 def test_module_level_imports():
     """Test that commonly used modules are imported at module level (not inline)."""
     errors = []
-    coordinator_file = (
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "coordinator.py"
-    )
-
-    if not coordinator_file.exists():
+    if (analysis := _analyze_coordinator()) is None:
         return ["coordinator.py not found"]
 
-    content = coordinator_file.read_text()
+    content = analysis.content
 
-    # Check for inline imports that should be at module level
-    inline_imports = [
-        ("uuid", r"(?<!^)import uuid\b"),
-    ]
+    # Module-level imports live in the first 50 lines
+    first_50_lines = _head(content, 50)
 
-    for module_name, pattern in inline_imports:
-        # First check if it's imported at module level (in first 50 lines)
-        first_50_lines = "\n".join(content.split("\n")[:50])
-        if f"import {module_name}" in first_50_lines:
+    # Check for inline imports that should be at module level
+    for module_name in _MODULE_LEVEL_IMPORTS:
+        needle = f"import {module_name}"
+        # First check if it's imported at module level
+        if needle in first_50_lines:
             # Good, it's at module level - now check for duplicate inline imports
-            matches = list(re.finditer(pattern, content, re.MULTILINE))
-            for match in matches:
-                line_num = content[: match.start()].count("\n") + 1
-                if line_num > 50:  # Skip module-level import
-                    errors.append(
-                        f"coordinator.py:{line_num}: Inline 'import {module_name}' - already imported at module level"
-                    )
+            # past line 50, i.e. indented (not at line start) whole-word imports
+            idx = len(first_50_lines)
+            while (idx := content.find(needle, idx + 1)) != -1:
+                after = content[idx + len(needle) : idx + len(needle) + 1]
+                if content[idx - 1] == "\n" or after.isalnum() or after == "_":
+                    continue
+                line_num = _line_number(content, idx)
+                errors.append(
+                    f"coordinator.py:{line_num}: Inline 'import {module_name}' - already imported at module level"
+                )
         else:
             # Check if it's used but not imported at module level
             if module_name in content:
@@ -345,37 +478,17 @@ def test_module_level_imports():
 def test_async_method_exception_handling():
     """Test that critical async methods have exception handling."""
     errors = []
-    coordinator_file = (
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "coordinator.py"
-    )
-
-    if not coordinator_file.exists():
+    if (analysis := _analyze_coordinator()) is None:
         return ["coordinator.py not found"]
 
-    content = coordinator_file.read_text()
-
-    # Critical async methods that should have try/except
-    critical_methods = [
-        "async_add_alarm",
-        "async_update_alarm",
-        "async_remove_alarm",
-    ]
-
-    for method_name in critical_methods:
-        # Find method definition
-        method_pattern = rf"async def {method_name}\(self.*?(?=\n    async def |\n    def |\nclass |\Z)"
-        match = re.search(method_pattern, content, re.DOTALL)
+    for func in analysis.functions:
+        if not isinstance(func, ast.AsyncFunctionDef) or func.name not in _CRITICAL_METHODS:
+            continue
 
-        if match:
-            method_content = match.group()
-            if "try:" not in method_content or "except" not in method_content:
-                line_num = content[: match.start()].count("\n") + 1
-                errors.append(
-                    f"coordinator.py:{line_num}: Async method '{method_name}' missing exception handling"
-                )
+        if not _has_try(func):
+            errors.append(
+                f"coordinator.py:{func.lineno}: Async method '{func.name}' missing exception handling"
+            )
 
     return errors
 
@@ -383,21 +496,12 @@ def test_async_method_exception_handling():
 def test_entity_base_classes():
     """Test that entities use correct base classes."""
     errors = []
-    entity_files = [
-        "switch.py",
-        "sensor.py",
-        "binary_sensor.py",
-        "time.py",
-    ]
-
-    base_path = Path(__file__).parent.parent / "custom_components" / "alarm_clock"
-
-    for filename in entity_files:
-        file_path = base_path / filename
+    for file_path in _ENTITY_FILES:
         if not file_path.exists():
             continue
+        filename = file_path.name
 
-        content = file_path.read_text()
+        content = _read_text(file_path)
 
         # Check that RestoreEntity is imported if needed
         if "async_get_last_state" in content and "RestoreEntity" not in content:
@@ -406,9 +510,8 @@ def test_entity_base_classes():
             )
 
     # Check entity.py uses RestoreEntity
-    entity_file = base_path / "entity.py"
-    if entity_file.exists():
-        content = entity_file.read_text()
+    if _ENTITY.exists():
+        content = _read_text(_ENTITY)
         if "class AlarmClockEntity(Entity)" in content:
             if "RestoreEntity" not in content:
                 errors.append("entity.py: AlarmClockEntity should extend RestoreEntity")
@@ -416,56 +519,64 @@ def test_entity_base_classes():
     return errors
 
 
-def test_javascript_version():
-    """Test that JavaScript card has version identifier."""
-    errors = []
-    js_files = [
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "alarm-clock-card.js",
-        Path(__file__).parent.parent / "www" / "alarm-clock-card.js",
-    ]
+def _check_javascript_version():
+    """Check the JavaScript card versions, returning (errors, version lines).
 
-    for js_file in js_files:
+    Version lines are returned rather than printed so main() can report them
+    under their own heading regardless of which worker ran the check.
+    """
+    errors = []
+    notes = []
+    for js_file in _JS_FILES:
         if not js_file.exists():
             errors.append(f"{js_file.name} not found")
             continue
 
-        content = js_file.read_text()
+        content = _read_text(js_file)
+
+        version = None
+        has_version_ref = False
+        has_deprecated = False
+        for match in _JS_SCAN_RE.finditer(content):
+            if match.lastgroup == "version":
+                has_version_ref = True
+                version = version or match.group("version")
+            elif match.lastgroup == "version_ref":
+                has_version_ref = True
+            else:
+                has_deprecated = True
 
         # Check for version constant
-        if "CARD_VERSION" not in content:
+        if not has_version_ref:
             errors.append(f"{js_file.name}: Missing CARD_VERSION constant")
+        elif version:
+            notes.append(f"{js_file.name}: Version {version}")
         else:
-            # Extract version
-            version_match = re.search(r'CARD_VERSION\s*=\s*["\']([^"\']+)["\']', content)
-            if version_match:
-                print(f"  {js_file.name}: Version {version_match.group(1)}")
-            else:
-                errors.append(f"{js_file.name}: CARD_VERSION format invalid")
+            errors.append(f"{js_file.name}: CARD_VERSION format invalid")
 
         # Check that removed methods don't exist
-        if "_setViewMode" in content:
+        if has_deprecated:
             errors.append(
                 f"{js_file.name}: Found deprecated _setViewMode method (should be removed)"
             )
 
+    return errors, notes
+
+
+def test_javascript_version():
+    """Test that JavaScript card has version identifier."""
+    errors, _notes = _check_javascript_version()
     return errors
 
 
 def test_domain_consistency():
     """Test that DOMAIN constant is consistent across files."""
     errors = []
-    const_file = (
-        Path(__file__).parent.parent / "custom_components" / "alarm_clock" / "const.py"
-    )
-
-    if not const_file.exists():
+    if not _CONST.exists():
         return ["const.py not found"]
 
-    content = const_file.read_text()
-    domain_match = re.search(r'DOMAIN\s*(?::\s*Final\s*)?=\s*["\']([^"\']+)["\']', content)
+    content = _read_text(_CONST)
+    domain_match = _DOMAIN_RE.search(content)
 
     if not domain_match:
         return ["DOMAIN not found in const.py"]
@@ -481,18 +592,9 @@ def test_domain_consistency():
 def test_service_definitions():
     """Test that services.yaml is valid."""
     errors = []
-    services_file = (
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "services.yaml"
-    )
-
-    if not services_file.exists():
+    if not _SERVICES_YAML.exists():
         return ["services.yaml not found"]
 
-    content = services_file.read_text()
-
     # Check for required services
     required_services = [
         "snooze",
@@ -504,9 +606,12 @@ def test_service_definitions():
         "delete_alarm",
     ]
 
-    for service in required_services:
-        if f"{service}:" not in content:
-            errors.append(f"services.yaml: Missing service '{service}'")
+    defined = _service_names()
+    errors.extend(
+        f"services.yaml: Missing service '{service}'"
+        for service in required_services
+        if service not in defined
+    )
 
     return errors
 
@@ -514,35 +619,21 @@ def test_service_definitions():
 def test_config_flow_exception_handling():
     """Test that config flow has exception handling for coordinator calls."""
     errors = []
-    config_flow_file = (
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "config_flow.py"
-    )
-
-    if not config_flow_file.exists():
+    if not _CONFIG_FLOW.exists():
         return ["config_flow.py not found"]
 
-    content = config_flow_file.read_text()
+    content = _read_text(_CONFIG_FLOW)
 
     # Find coordinator calls that should have exception handling
-    coordinator_calls = [
-        r"await coordinator\.async_add_alarm\(",
-        r"await coordinator\.async_remove_alarm\(",
-        r"await coordinator\.async_update_alarm\(",
-    ]
-
-    for pattern in coordinator_calls:
-        matches = list(re.finditer(pattern, content))
-        for match in matches:
+    for pattern in _CONFIG_FLOW_COORDINATOR_CALL_RES:
+        for match in pattern.finditer(content):
             # Check if this call is within a try block
-            start = max(0, match.start() - 500)
-            context_before = content[start : match.start()]
+            end = match.start()
+            start = max(0, end - 500)
 
             # Simple check: count try vs except in context
-            if context_before.count("try:") <= context_before.count("except"):
-                line_num = content[: match.start()].count("\n") + 1
+            if content.count("try:", start, end) <= content.count("except", start, end):
+                line_num = _line_number(content, match.start())
                 errors.append(
                     f"config_flow.py:{line_num}: Coordinator call without exception handling"
                 )
@@ -553,31 +644,20 @@ def test_config_flow_exception_handling():
 def test_store_load_exception_handling():
     """Test that store.async_load has exception handling."""
     errors = []
-    init_file = (
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "__init__.py"
-    )
-
-    if not init_file.exists():
+    if not _INIT.exists():
         return ["__init__.py not found"]
 
-    content = init_file.read_text()
+    content = _read_text(_INIT)
 
     # Find store.async_load call
-    if "await store.async_load()" in content:
+    idx = content.find("await store.async_load()")
+    if idx != -1:
         # Check if it's within a try block
-        match = re.search(r"await store\.async_load\(\)", content)
-        if match:
-            start = max(0, match.start() - 300)
-            context_before = content[start : match.start()]
-
-            if "try:" not in context_before:
-                line_num = content[: match.start()].count("\n") + 1
-                errors.append(
-                    f"__init__.py:{line_num}: store.async_load() should have exception handling"
-                )
+        if content.find("try:", max(0, idx - 300), idx) == -1:
+            line_num = _line_number(content, idx)
+            errors.append(
+                f"__init__.py:{line_num}: store.async_load() should have exception handling"
+            )
 
     return errors
 
@@ -585,23 +665,15 @@ def test_store_load_exception_handling():
 def test_timezone_aware_datetime():
     """Test that state_machine.py uses dt_util.now() instead of datetime.now()."""
     errors = []
-    state_machine_file = (
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "state_machine.py"
-    )
-
-    if not state_machine_file.exists():
+    if not _STATE_MACHINE.exists():
         return ["state_machine.py not found"]
 
-    content = state_machine_file.read_text()
+    content = _read_text(_STATE_MACHINE)
 
     # Check that datetime.now() is not used (should use dt_util.now() for timezone awareness)
-    datetime_now_pattern = r"datetime\.now\(\)"
-    matches = list(re.finditer(datetime_now_pattern, content))
-    for match in matches:
-        line_num = content[: match.start()].count("\n") + 1
+    idx = -1
+    while (idx := content.find("datetime.now()", idx + 1)) != -1:
+        line_num = _line_number(content, idx)
         errors.append(
             f"state_machine.py:{line_num}: Use dt_util.now() instead of datetime.now() for timezone awareness"
         )
@@ -618,38 +690,25 @@ def test_timezone_aware_datetime():
 def test_variable_scope_in_exception_handling():
     """Test that variables used after try blocks are defined before them."""
     errors = []
-    coordinator_file = (
-        Path(__file__).parent.parent
-        / "custom_components"
-        / "alarm_clock"
-        / "coordinator.py"
-    )
-
-    if not coordinator_file.exists():
+    if (analysis := _analyze_coordinator()) is None:
         return ["coordinator.py not found"]
 
-    content = coordinator_file.read_text()
+    content = analysis.content
 
     # Check async_remove_alarm: entities_removed_count should be defined before try block
-    remove_alarm_pattern = r"async def async_remove_alarm\(self.*?(?=\n    async def |\n    def |\nclass |\Z)"
-    match = re.search(remove_alarm_pattern, content, re.DOTALL)
-    if match:
-        method_content = match.group()
-
-        # Check that entities_removed_count is initialized before try block
-        if "entities_removed_count" in method_content:
-            # Find first occurrence of entities_removed_count
-            first_use = method_content.find("entities_removed_count")
-            try_pos = method_content.find("try:")
-
-            if try_pos != -1 and first_use > try_pos:
-                # Check if it's an assignment before try
-                pre_try = method_content[:try_pos]
-                if "entities_removed_count" not in pre_try:
-                    line_num = content[: match.start()].count("\n") + 1
-                    errors.append(
-                        f"coordinator.py: async_remove_alarm should initialize entities_removed_count before try block"
-                    )
+    remove_alarm_block = _method_block(content, "async def async_remove_alarm(self")
+    if remove_alarm_block:
+        _, method_content = remove_alarm_block
+
+        # Check that entities_removed_count is initialized before try block:
+        # its first occurrence must not come after the first try
+        first_use = method_content.find("entities_removed_count")
+        try_pos = method_content.find("try:")
+
+        if -1 < try_pos < first_use:
+            errors.append(
+                "coordinator.py: async_remove_alarm should initialize entities_removed_count before try block"
+            )
 
     return errors
 
@@ -673,7 +732,7 @@ def main():
         ("Module level imports", test_module_level_imports),
         ("Async method exceptions", test_async_method_exception_handling),
         ("Entity base classes", test_entity_base_classes),
-        ("JavaScript version", test_javascript_version),
+        ("JavaScript version", _check_javascript_version),
         ("Domain consistency", test_domain_consistency),
         ("Service definitions", test_service_definitions),
         ("Config flow exceptions", test_config_flow_exception_handling),
@@ -682,9 +741,17 @@ def main():
         ("Variable scope in exceptions", test_variable_scope_in_exception_handling),
     ]
 
-    for test_name, test_func in tests:
+    # The checks share no state, so run them concurrently and report the
+    # results in declaration order to keep the output deterministic
+    with ThreadPoolExecutor(max_workers=min(8, len(tests))) as executor:
+        results = list(executor.map(lambda test: test[1](), tests))
+
+    for (test_name, _test_func), result in zip(tests, results, strict=True):
         print(f"Testing {test_name}...")
-        errors = test_func()
+        # Checks with informational output return (errors, notes)
+        errors, notes = result if isinstance(result, tuple) else (result, [])
+        for note in notes:
+            print(f"  {note}")
         if errors:
             all_errors.extend(errors)
             for error in errors:
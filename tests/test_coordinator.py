@@ -132,6 +132,82 @@ class TestAlarmClockCoordinator:
         assert "test_alarm" not in coordinator.alarms
         mock_store.async_remove_alarm.assert_called_once_with("test_alarm")
 
+    @staticmethod
+    def _registry_entries(*unique_ids: str) -> list[MagicMock]:
+        """Create registry entries whose entity_id mirrors their unique_id."""
+        return [
+            MagicMock(entity_id=f"sensor.{unique_id}", unique_id=unique_id)
+            for unique_id in unique_ids
+        ]
+
+    async def _remove_with_registry(self, coordinator, alarm_id, registry_entries):
+        """Remove an alarm against a mock registry, returning the removed entity IDs."""
+        entity_registry = MagicMock()
+        with patch(
+            "custom_components.alarm_clock.coordinator.er.async_get",
+            return_value=entity_registry,
+        ), patch(
+            "custom_components.alarm_clock.coordinator.er.async_entries_for_config_entry",
+            return_value=registry_entries,
+        ) as mock_entries:
+            result = await coordinator.async_remove_alarm(alarm_id)
+
+        assert result is True
+        mock_entries.assert_called_once_with(entity_registry, "test_entry")
+        return [call.args[0] for call in entity_registry.async_remove.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_remove_alarm_removes_only_its_entities(self, coordinator, mock_store):
+        """Test removing alarm_1 removes all its entities but leaves alarm_10 untouched."""
+        mock_store.get_all_alarms.return_value = [
+            AlarmData(alarm_id="alarm_1", name="One", time="07:00"),
+            AlarmData(alarm_id="alarm_10", name="Ten", time="08:00"),
+        ]
+        await coordinator.async_start()
+
+        removed = await self._remove_with_registry(
+            coordinator,
+            "alarm_1",
+            self._registry_entries(
+                "test_entry_alarm_1_state",
+                # Disabled entities are only in the registry, never added to hass
+                "test_entry_alarm_1_next_trigger",
+                "test_entry_alarm_10_state",
+                "test_entry_alarm_10_next_trigger",
+                "test_entry_health",
+            ),
+        )
+
+        assert removed == [
+            "sensor.test_entry_alarm_1_state",
+            "sensor.test_entry_alarm_1_next_trigger",
+        ]
+        assert "alarm_1" not in coordinator.alarms
+        assert "alarm_10" in coordinator.alarms
+
+    @pytest.mark.asyncio
+    async def test_remove_alarm_leaves_prefix_sibling_untouched(self, coordinator, mock_store):
+        """Test removing alarm_10 does not touch alarm_1's entities, and vice versa."""
+        mock_store.get_all_alarms.return_value = [
+            AlarmData(alarm_id="alarm_1", name="One", time="07:00"),
+            AlarmData(alarm_id="alarm_10", name="Ten", time="08:00"),
+        ]
+        await coordinator.async_start()
+        registry_entries = self._registry_entries(
+            "test_entry_alarm_1_state",
+            "test_entry_alarm_1_snooze_count",
+            "test_entry_alarm_10_state",
+        )
+
+        removed = await self._remove_with_registry(coordinator, "alarm_10", registry_entries)
+        assert removed == ["sensor.test_entry_alarm_10_state"]
+
+        removed = await self._remove_with_registry(coordinator, "alarm_1", registry_entries)
+        assert removed == [
+            "sensor.test_entry_alarm_1_state",
+            "sensor.test_entry_alarm_1_snooze_count",
+        ]
+
     @pytest.mark.asyncio
     async def test_remove_nonexistent_alarm(self, coordinator):
         """Test removing an alarm that doesn't exist."""
@@ -226,6 +302,24 @@ class TestAlarmClockCoordinator:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_active_alarm_ids_track_transitions(self, coordinator, alarm_data, mock_store):
+        """Test active alarm IDs follow state transitions and removal."""
+        mock_store.get_all_alarms.return_value = [alarm_data]
+        await coordinator.async_start()
+
+        assert coordinator.active_alarm_ids == set()
+
+        await coordinator.alarms["test_alarm"].transition_to(AlarmState.RINGING)
+        assert coordinator.active_alarm_ids == {"test_alarm"}
+
+        await coordinator.async_dismiss("test_alarm")
+        assert coordinator.active_alarm_ids == set()
+
+        await coordinator.alarms["test_alarm"].transition_to(AlarmState.RINGING)
+        await coordinator.async_remove_alarm("test_alarm")
+        assert coordinator.active_alarm_ids == set()
+
     @pytest.mark.asyncio
     async def test_skip_next(self, coordinator, alarm_data, mock_store):
         """Test skipping next occurrence."""
@@ -325,6 +419,14 @@ class TestAlarmClockCoordinator:
         assert "healthy" in status
         assert status["healthy"] is True
 
+    def test_device_info_shared(self, coordinator):
+        """Test device info is built once and shared."""
+        device_info = coordinator.device_info
+
+        assert device_info["identifiers"] == {("alarm_clock", "test_entry")}
+        assert device_info["name"] == "Test Alarm Clock"
+        assert coordinator.device_info is device_info
+
     @pytest.mark.asyncio
     async def test_events_fired(self, coordinator, alarm_data, mock_store, mock_hass):
         """Test events are fired on state changes."""
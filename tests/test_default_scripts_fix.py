@@ -1,17 +1,48 @@
 """Test the default scripts bug fix."""
 
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from custom_components.alarm_clock.config_flow import AlarmClockOptionsFlow
+
+
+async def _submit_default_scripts(existing_options, user_input):
+    """Submit the default scripts step and return (result, entry, hass)."""
+    config_entry = MagicMock(entry_id="test_entry", options=existing_options)
+    flow = AlarmClockOptionsFlow(config_entry)
+    flow.hass = MagicMock()
+    flow.handler = config_entry.entry_id
+    flow.flow_id = "test_flow"
+
+    with patch.object(
+        AlarmClockOptionsFlow, "config_entry", new_callable=PropertyMock
+    ) as mock_entry:
+        mock_entry.return_value = config_entry
+        result = await flow.async_step_default_scripts(user_input)
+
+    return result, config_entry, flow.hass
+
+
+async def _saved_options(existing_options, user_input):
+    """Submit the default scripts step and return the options it saved."""
+    _result, config_entry, hass = await _submit_default_scripts(existing_options, user_input)
+    update_entry = hass.config_entries.async_update_entry
+    update_entry.assert_called_once()
+    assert update_entry.call_args.args == (config_entry,)
+    return update_entry.call_args.kwargs["options"]
+
 
 class TestDefaultScriptsFix:
     """Test that the default scripts save/load fix works correctly."""
 
-    def test_cleared_fields_are_removed(self):
+    @pytest.mark.asyncio
+    async def test_cleared_fields_are_removed(self):
         """Test that cleared default_script_ fields are properly removed.
-        
-        This is a unit test for the bug fix in async_step_default_scripts.
+
         When a user clears an optional script field, it should be removed from
         the config entry options, not persist with the old value.
         """
-        # Simulate existing options with default scripts
         existing_options = {
             "default_script_pre_alarm": "script.morning_pre",
             "default_script_alarm": "script.morning_alarm",
@@ -19,34 +50,51 @@ class TestDefaultScriptsFix:
             "other_setting": "keep_this",
             "another_setting": "also_keep",
         }
-        
-        # Simulate user input where pre_alarm and post_alarm are cleared
-        # (not included in the submission)
+
+        # pre_alarm and post_alarm are cleared, so they are not submitted
         user_input = {
             "default_script_alarm": "script.new_alarm",
-            # Note: pre_alarm and post_alarm are NOT in user_input (cleared)
-        }
-        
-        # Apply the fix logic from async_step_default_scripts
-        updated_options = {
-            k: v
-            for k, v in existing_options.items()
-            if not k.startswith("default_script_")
         }
-        updated_options.update(user_input)
-        
+
+        updated_options = await _saved_options(existing_options, user_input)
+
         # Verify cleared fields are removed
         assert "default_script_pre_alarm" not in updated_options
         assert "default_script_post_alarm" not in updated_options
-        
+
         # Verify updated field has new value
         assert updated_options["default_script_alarm"] == "script.new_alarm"
-        
+
         # Verify non-default-script settings are preserved
         assert updated_options["other_setting"] == "keep_this"
         assert updated_options["another_setting"] == "also_keep"
-    
-    def test_all_fields_cleared(self):
+
+    @pytest.mark.asyncio
+    async def test_cleared_fields_submitted_empty(self):
+        """Test that fields submitted as "" or None are removed, not saved."""
+        existing_options = {
+            "default_script_pre_alarm": "script.morning_pre",
+            "default_script_alarm": "script.morning_alarm",
+            "default_script_on_snooze": "script.snooze",
+            "other_setting": "keep_this",
+        }
+
+        # Clearing a previously set selector can submit "" or None
+        user_input = {
+            "default_script_pre_alarm": "",
+            "default_script_alarm": "script.new_alarm",
+            "default_script_on_snooze": None,
+        }
+
+        updated_options = await _saved_options(existing_options, user_input)
+
+        assert "default_script_pre_alarm" not in updated_options
+        assert "default_script_on_snooze" not in updated_options
+        assert updated_options["default_script_alarm"] == "script.new_alarm"
+        assert updated_options["other_setting"] == "keep_this"
+
+    @pytest.mark.asyncio
+    async def test_all_fields_cleared(self):
         """Test that all default script fields can be cleared."""
         existing_options = {
             "default_script_pre_alarm": "script.morning_pre",
@@ -54,75 +102,77 @@ class TestDefaultScriptsFix:
             "default_script_timeout": 30,
             "other_setting": "keep_this",
         }
-        
+
         # User clears all script fields (none in user_input)
-        user_input = {}
-        
-        # Apply the fix logic
-        updated_options = {
-            k: v
-            for k, v in existing_options.items()
-            if not k.startswith("default_script_")
-        }
-        updated_options.update(user_input)
-        
+        updated_options = await _saved_options(existing_options, {})
+
         # All default_script_ fields should be removed
         assert "default_script_pre_alarm" not in updated_options
         assert "default_script_alarm" not in updated_options
         assert "default_script_timeout" not in updated_options
-        
+
         # Other settings preserved
-        assert updated_options["other_setting"] == "keep_this"
-    
-    def test_no_existing_default_scripts(self):
+        assert updated_options == {"other_setting": "keep_this"}
+
+    @pytest.mark.asyncio
+    async def test_no_existing_default_scripts(self):
         """Test behavior when there are no existing default scripts."""
         existing_options = {
             "other_setting": "keep_this",
         }
-        
+
         # User adds a new default script
         user_input = {
             "default_script_alarm": "script.new_alarm",
         }
-        
-        # Apply the fix logic
-        updated_options = {
-            k: v
-            for k, v in existing_options.items()
-            if not k.startswith("default_script_")
-        }
-        updated_options.update(user_input)
-        
+
+        updated_options = await _saved_options(existing_options, user_input)
+
         # New script should be added
         assert updated_options["default_script_alarm"] == "script.new_alarm"
-        
+
         # Other settings preserved
         assert updated_options["other_setting"] == "keep_this"
-    
-    def test_old_behavior_was_broken(self):
+
+    @pytest.mark.asyncio
+    async def test_unchanged_submit_skips_update(self):
+        """Test that resubmitting the saved values does not rewrite the entry."""
+        existing_options = {
+            "default_script_alarm": "script.morning_alarm",
+            "default_script_timeout": 30,
+            "other_setting": "keep_this",
+        }
+        user_input = {
+            "default_script_alarm": "script.morning_alarm",
+            "default_script_timeout": 30,
+        }
+
+        result, _config_entry, hass = await _submit_default_scripts(existing_options, user_input)
+
+        hass.config_entries.async_update_entry.assert_not_called()
+        assert result["type"] == "create_entry"
+        assert result["data"] == {}
+
+    @pytest.mark.asyncio
+    async def test_old_behavior_was_broken(self):
         """Demonstrate that the old merge behavior kept old values."""
         existing_options = {
             "default_script_pre_alarm": "script.old",
             "other_setting": "keep_this",
         }
-        
+
         # User clears pre_alarm (not in user_input)
         user_input = {}
-        
+
         # OLD BROKEN BEHAVIOR: simple merge
         old_behavior = {**existing_options, **user_input}
-        
+
         # The bug: old value persists even though user cleared it
         assert "default_script_pre_alarm" in old_behavior
         assert old_behavior["default_script_pre_alarm"] == "script.old"
-        
+
         # NEW FIXED BEHAVIOR
-        new_behavior = {
-            k: v
-            for k, v in existing_options.items()
-            if not k.startswith("default_script_")
-        }
-        new_behavior.update(user_input)
-        
+        new_behavior = await _saved_options(existing_options, user_input)
+
         # The fix: old value is removed as expected
         assert "default_script_pre_alarm" not in new_behavior
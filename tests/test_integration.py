@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 from homeassistant.core import HomeAssistant
 
+from custom_components.alarm_clock import (
+    _async_cleanup_orphan_entities,
+    _async_cleanup_stored_orphans,
+)
 from custom_components.alarm_clock.state_machine import AlarmData
 
 
@@ -169,3 +175,135 @@ class TestReliability:
     async def test_idempotent_trigger(self, hass: HomeAssistant):
         """Test same alarm can't trigger twice in same minute."""
         pass
+
+
+class TestOrphanEntityCleanup:
+    """Tests for removing entities of alarms that no longer exist."""
+
+    @staticmethod
+    def _registry_entry(unique_id: str) -> MagicMock:
+        """Create a registry entry whose entity_id mirrors its unique_id."""
+        return MagicMock(entity_id=f"sensor.{unique_id}", unique_id=unique_id)
+
+    async def _cleanup(self, unique_ids: list[str], valid_alarm_ids: set[str], registry=None):
+        """Run the cleanup against a mock registry holding the given unique IDs."""
+        registry = registry or MagicMock()
+        entry = MagicMock(entry_id="test_entry")
+        with (
+            patch("custom_components.alarm_clock.er.async_get", return_value=registry),
+            patch(
+                "custom_components.alarm_clock.er.async_entries_for_config_entry",
+                return_value=[self._registry_entry(unique_id) for unique_id in unique_ids],
+            ),
+        ):
+            result = await _async_cleanup_orphan_entities(MagicMock(), entry, valid_alarm_ids)
+        removed = [call.args[0] for call in registry.async_remove.call_args_list]
+        return result, removed
+
+    @pytest.mark.asyncio
+    async def test_keeps_valid_and_device_entities(self):
+        """Test entity types containing underscores are not mistaken for orphans."""
+        result, removed = await self._cleanup(
+            [
+                "test_entry_alarm_abc_state",
+                "test_entry_alarm_abc_next_trigger",
+                "test_entry_alarm_abc_skip_next",
+                "test_entry_alarm_abc_snooze_count",
+                "test_entry_health",
+                "test_entry_any_ringing",
+                "test_entry_next_alarm",
+            ],
+            {"alarm_abc"},
+        )
+
+        assert result is True
+        assert removed == []
+
+    @pytest.mark.asyncio
+    async def test_removes_orphaned_entities(self):
+        """Test entities of deleted alarms are removed and valid ones are kept."""
+        result, removed = await self._cleanup(
+            [
+                "test_entry_alarm_abc_next_trigger",
+                "test_entry_alarm_old_next_trigger",
+                "test_entry_alarm_old_state",
+                "test_entry_health",
+            ],
+            {"alarm_abc"},
+        )
+
+        assert result is True
+        assert removed == [
+            "sensor.test_entry_alarm_old_next_trigger",
+            "sensor.test_entry_alarm_old_state",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reports_failed_removals(self):
+        """Test the cleanup returns False when an orphan could not be removed."""
+        registry = MagicMock()
+        registry.async_remove.side_effect = [None, RuntimeError("registry busy")]
+
+        result, removed = await self._cleanup(
+            ["test_entry_alarm_old_state", "test_entry_alarm_old_skip_next"],
+            set(),
+            registry,
+        )
+
+        assert result is False
+        assert removed == [
+            "sensor.test_entry_alarm_old_state",
+            "sensor.test_entry_alarm_old_skip_next",
+        ]
+
+    async def _cleanup_stored(self, store: MagicMock, unique_ids: list[str]):
+        """Run the setup-time cleanup for a store, returning the removed entity IDs."""
+        registry = MagicMock()
+        with (
+            patch("custom_components.alarm_clock.er.async_get", return_value=registry),
+            patch(
+                "custom_components.alarm_clock.er.async_entries_for_config_entry",
+                return_value=[self._registry_entry(unique_id) for unique_id in unique_ids],
+            ) as mock_entries,
+        ):
+            await _async_cleanup_stored_orphans(
+                MagicMock(), MagicMock(entry_id="test_entry"), store
+            )
+        removed = [call.args[0] for call in registry.async_remove.call_args_list]
+        return removed, mock_entries
+
+    @pytest.mark.asyncio
+    async def test_setup_cleans_up_when_store_is_missing(self):
+        """Test leftover entities are removed even when the store file was missing."""
+        store = MagicMock()
+        store.iter_alarm_ids.side_effect = lambda: iter([])
+
+        removed, mock_entries = await self._cleanup_stored(
+            store, ["test_entry_alarm_old_state", "test_entry_health"]
+        )
+
+        assert removed == ["sensor.test_entry_alarm_old_state"]
+        mock_entries.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_setup_cleanup_with_empty_registry(self):
+        """Test a fresh install with no registry entries removes nothing."""
+        store = MagicMock()
+        store.iter_alarm_ids.side_effect = lambda: iter([])
+
+        removed, _mock_entries = await self._cleanup_stored(store, [])
+
+        assert removed == []
+
+    @pytest.mark.asyncio
+    async def test_setup_cleans_up_against_stored_alarms(self):
+        """Test setup removes entities of alarms missing from the store on every start."""
+        store = MagicMock()
+        store.iter_alarm_ids.side_effect = lambda: iter(["alarm_abc"])
+        unique_ids = ["test_entry_alarm_abc_state", "test_entry_alarm_old_state"]
+
+        # Runs again on a second start with the same alarms; nothing is persisted
+        for _ in range(2):
+            removed, mock_entries = await self._cleanup_stored(store, unique_ids)
+            assert removed == ["sensor.test_entry_alarm_old_state"]
+            mock_entries.assert_called_once()